@@ -106,4 +106,4 @@ def setup(app: Sphinx):
     app.add_directive("ref_arxiv", Arxiv)
     app.add_directive("ref_website", WebSite)
 
-    return {"parallel_read_safe": True}
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -13,229 +13,168 @@
 """
 A class that formats documentation sections.
 """
-from typing import List
+import textwrap
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
 from .utils import _check_no_indent, _write_options
 
 
-class DocstringSectionFormatter:
-    """A class that formats parsed docstring lines.
+@lru_cache(maxsize=4096)
+def _format_section(header: Tuple[str, ...], lines: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Format section lines with a header and a trailing empty line.
 
-    This formatter formats sections with Google Style Python Docstrings with
-    several reStructuredText directives.
+    Many classes share identical boilerplate sections, so formatted
+    sections are cached by the header and the section lines.
     """
+    return header + lines + ("",)
 
-    def __init__(self, indent: str):
-        self.indent = indent
-
-    def format_header(self, lines: List[str]) -> List[str]:
-        """Format header section."""
-        format_lines = lines
-        format_lines.append("")
 
-        return format_lines
+@lru_cache(maxsize=4096)
+def _format_indented_section(
+    header: Tuple[str, ...], lines: Tuple[str, ...], indent: str
+) -> Tuple[str, ...]:
+    """Format section lines as the indented body of a directive."""
+    body = textwrap.indent("\n".join(lines), indent, lambda _: True).split("\n")
+    return header + tuple(body) + ("",)
 
-    @_check_no_indent
-    def format_overview(self, lines: List[str]) -> List[str]:
-        """Format overview section."""
-        format_lines = [
-            ""
-            ".. rubric:: Overview",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
-
-        return format_lines
 
-    @_check_no_indent
-    def format_reference(self, lines: List[str]) -> List[str]:
-        """Format reference section."""
-        format_lines = [
-            ".. rubric:: References",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
-
-        return format_lines
-
-    def format_warning(self, lines: List[str]) -> List[str]:
-        """Format warning section."""
-        format_lines = [".. warning::", ""]
-        for line in lines:
-            format_lines.append(self.indent + line)
-        format_lines.append("")
-
-        return format_lines
+# Section body styles
+_PLAIN = "plain"  # lines are written as is
+_RUBRIC = "rubric"  # lines are written as is after checking their indentation
+_DIRECTIVE = "directive"  # lines are indented as the body of a directive
+_OPTIONS = "options"  # lines are parsed option directives written by _write_options
 
-    @_check_no_indent
-    def format_example(self, lines: List[str]) -> List[str]:
-        """Format example section."""
-        format_lines = [
-            ".. rubric:: Example",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
-
-        return format_lines
-
-    def format_note(self, lines: List[str]) -> List[str]:
-        """Format notification section."""
-        format_lines = [".. note::", ""]
-        for line in lines:
-            format_lines.append(self.indent + line)
-        format_lines.append("")
-
-        return format_lines
 
-    @_check_no_indent
-    def format_see_also(self, lines: List[str]) -> List[str]:
-        """Format see also section."""
-        format_lines = [
-            ".. rubric:: See also",
-            "",
-        ]
+class DocstringSectionFormatter:
+    """A class that formats parsed docstring lines.
 
-        format_lines.extend(lines)
-        format_lines.append("")
+    This formatter formats sections with Google Style Python Docstrings with
+    several reStructuredText directives. Each section is described by an entry of
+    ``__section_specs__`` mapping the section name to the header lines and the style
+    of the section body.
+    """
 
-        return format_lines
+    __section_specs__: Dict[str, Tuple[Tuple[str, ...], str]] = {
+        "header": ((), _PLAIN),
+        "overview": ((".. rubric:: Overview", ""), _RUBRIC),
+        "reference": ((".. rubric:: References", ""), _RUBRIC),
+        "warning": ((".. warning::", ""), _DIRECTIVE),
+        "example": ((".. rubric:: Example", ""), _RUBRIC),
+        "note": ((".. note::", ""), _DIRECTIVE),
+        "see_also": ((".. rubric:: See also", ""), _RUBRIC),
+        "manual": ((".. rubric:: User manual", ""), _RUBRIC),
+        "init": ((".. rubric:: Initialization", ""), _RUBRIC),
+    }
 
-    @_check_no_indent
-    def format_manual(self, lines: List[str]) -> List[str]:
-        """Format user manual section."""
-        format_lines = [
-            ".. rubric:: User manual",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
+    def __init__(self, indent: str):
+        self.indent = indent
 
-        return format_lines
+    def format(self, section: str, lines: List[str]) -> Optional[Tuple[str, ...]]:
+        """Format lines of a section.
+
+        Args:
+            section: Name of the section.
+            lines: Parsed docstring lines of the section.
+
+        Returns:
+            Formatted lines, or ``None`` when this formatter doesn't define the section.
+        """
+        spec = self.__section_specs__.get(section, None)
+        if spec is None:
+            return None
+        header, style = spec
+        if style == _PLAIN:
+            return _format_section(header, tuple(lines))
+        if style == _DIRECTIVE:
+            return _format_indented_section(header, tuple(lines), self.indent)
+        return self._format_aligned(lines, header, style)
 
     @_check_no_indent
-    def format_init(self, lines: List[str]) -> List[str]:
-        """Format user manual section."""
-        format_lines = [
-            ".. rubric:: Initialization",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
-
-        return format_lines
+    def _format_aligned(
+        self, lines: List[str], header: Tuple[str, ...], style: str
+    ) -> Tuple[str, ...]:
+        """Format section lines that must not be indented."""
+        if style == _OPTIONS:
+            return header + tuple(_write_options(lines, self.indent)) + ("",)
+        return _format_section(header, tuple(lines))
 
 
 class ExperimentSectionFormatter(DocstringSectionFormatter):
     """Formatter for experiment class."""
 
-    @_check_no_indent
-    def format_analysis_ref(self, lines: List[str]) -> List[str]:
-        """Format analysis class reference section."""
-        format_lines = [
-            ".. rubric:: Analysis class reference",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
-
-        return format_lines
-
-    @_check_no_indent
-    def format_experiment_opts(self, lines: List[str]) -> List[str]:
-        """Format experiment options section."""
-        format_lines = [
-            ".. rubric:: Experiment options",
-            "",
-            "These options can be set by the :meth:`set_experiment_options` method.",
-            "",
-        ]
-        for line in _write_options(lines, self.indent):
-            format_lines.append(line)
-        format_lines.append("")
-
-        return format_lines
+    __section_specs__ = {
+        **DocstringSectionFormatter.__section_specs__,
+        "analysis_ref": ((".. rubric:: Analysis class reference", ""), _RUBRIC),
+        "experiment_opts": (
+            (
+                ".. rubric:: Experiment options",
+                "",
+                "These options can be set by the :meth:`set_experiment_options` method.",
+                "",
+            ),
+            _OPTIONS,
+        ),
+    }
 
 
 class AnalysisSectionFormatter(DocstringSectionFormatter):
     """Formatter for analysis class."""
 
-    @_check_no_indent
-    def format_analysis_opts(self, lines: List[str]) -> List[str]:
-        """Format analysis options section."""
-        format_lines = [
-            ".. rubric:: Analysis options",
-            "",
-            "These are the keyword arguments of :meth:`run` method.",
-            "",
-        ]
-        for line in _write_options(lines, self.indent):
-            format_lines.append(line)
-        format_lines.append("")
-
-        return format_lines
-
-    @_check_no_indent
-    def format_fit_model(self, lines: List[str]) -> List[str]:
-        """Format fit model section."""
-        format_lines = [
-            ".. rubric:: Fit model",
-            "",
-            "This is the curve fitting analysis. ",
-            "The following equation(s) are used to represent curve(s).",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
-
-        return format_lines
-
-    @_check_no_indent
-    def format_fit_parameters(self, lines: List[str]) -> List[str]:
-        """Format fit parameter section."""
-        format_lines = [
-            ".. rubric:: Fit parameters",
-            "",
-            "The following fit parameters are estimated during the analysis.",
-            "",
-        ]
-        format_lines.extend(lines)
-        format_lines.append("")
-
-        return format_lines
+    __section_specs__ = {
+        **DocstringSectionFormatter.__section_specs__,
+        "analysis_opts": (
+            (
+                ".. rubric:: Analysis options",
+                "",
+                "These are the keyword arguments of :meth:`run` method.",
+                "",
+            ),
+            _OPTIONS,
+        ),
+        "fit_model": (
+            (
+                ".. rubric:: Fit model",
+                "",
+                "This is the curve fitting analysis. ",
+                "The following equation(s) are used to represent curve(s).",
+                "",
+            ),
+            _RUBRIC,
+        ),
+        "fit_parameters": (
+            (
+                ".. rubric:: Fit parameters",
+                "",
+                "The following fit parameters are estimated during the analysis.",
+                "",
+            ),
+            _RUBRIC,
+        ),
+    }
 
 
 class VisualizationSectionFormatter(DocstringSectionFormatter):
     """Formatter for visualization classes."""
 
-    @_check_no_indent
-    def format_opts(self, lines: List[str]) -> List[str]:
-        """Format options section."""
-
-        format_lines = [
-            ".. rubric:: Options",
-            "",
-            "The following can be set using :meth:`set_options`.",
-            "",
-        ]
-        for line in _write_options(lines, self.indent):
-            format_lines.append(line)
-        format_lines.append("")
-
-        return format_lines
-
-    @_check_no_indent
-    def format_figure_opts(self, lines: List[str]) -> List[str]:
-        """Format figure options section."""
-        format_lines = [
-            ".. rubric:: Figure options",
-            "",
-            "The following can be set using :meth:`set_figure_options`.",
-            "",
-        ]
-        for line in _write_options(lines, self.indent):
-            format_lines.append(line)
-        format_lines.append("")
-
-        return format_lines
+    __section_specs__ = {
+        **DocstringSectionFormatter.__section_specs__,
+        "opts": (
+            (
+                ".. rubric:: Options",
+                "",
+                "The following can be set using :meth:`set_options`.",
+                "",
+            ),
+            _OPTIONS,
+        ),
+        "figure_opts": (
+            (
+                ".. rubric:: Figure options",
+                "",
+                "The following can be set using :meth:`set_figure_options`.",
+                "",
+            ),
+            _OPTIONS,
+        ),
+    }
@@ -17,7 +17,7 @@ import copy
 import re
 import sys
 from abc import ABC
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Tuple
 
 from qiskit_experiments.framework.base_analysis import BaseAnalysis
 from qiskit_experiments.framework.base_experiment import BaseExperiment
@@ -131,7 +131,7 @@ class QiskitExperimentDocstring(ABC):
         """Generate extra sections."""
         pass
 
-    def _format(self) -> Dict[str, List[str]]:
+    def _format(self) -> Dict[str, Tuple[str, ...]]:
         """Format each section with predefined formatter."""
         formatter = self.__formatter__(self._indent)
 
@@ -139,11 +139,10 @@ class QiskitExperimentDocstring(ABC):
         for section, lines in self._parsed_lines.items():
             if not lines:
                 continue
-            section_formatter = getattr(formatter, f"format_{section}", None)
-            if section_formatter:
-                formatted_sections[section] = section_formatter(lines)
-            else:
-                formatted_sections[section] = lines + [""]
+            formatted_lines = formatter.format(section, lines)
+            if formatted_lines is None:
+                formatted_lines = tuple(lines) + ("",)
+            formatted_sections[section] = formatted_lines
 
         return formatted_sections
 
@@ -33,4 +33,4 @@ class JupyterCellCheckEnv(JupyterCell):
 
 def setup(app: Sphinx):
     app.add_directive("jupyter-execute", JupyterCellCheckEnv, override=True)
-    return {"parallel_read_safe": True}
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
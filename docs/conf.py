@@ -18,6 +18,7 @@ import os
 import sys
 import subprocess
 import datetime
+import functools
 
 # -- Path setup --------------------------------------------------------------
 
@@ -73,6 +74,10 @@ templates_path = ["_templates"]
 nbsphinx_timeout = 360
 nbsphinx_execute = os.getenv("QISKIT_DOCS_BUILD_TUTORIALS", "never")
 nbsphinx_widgets_path = ""
+
+# List of patterns, relative to source directory, that match files and
+# directories to ignore when looking for source files.
+# This pattern also affects html_static_path and html_extra_path.
 exclude_patterns = ["_build", "**.ipynb_checkpoints"]
 
 # Thumbnails for experiment manuals from output images
@@ -103,7 +108,9 @@ autodoc_typehints = "description"
 # return type is always added to the description (if in the signature).
 autodoc_typehints_description_target = "documented_params"
 
-autosummary_generate = True
+# Stub pages are regenerated by default. Sphinx only rewrites stubs whose content changed, so
+# the doctree cache stays valid; set QISKIT_DOCS_REGEN_STUBS=0 to reuse existing stubs as is.
+autosummary_generate = os.getenv("QISKIT_DOCS_REGEN_STUBS", "1") == "1"
 
 autodoc_default_options = {"inherited-members": None}
 
@@ -118,11 +125,6 @@ numfig_format = {"table": "Table %s"}
 
 language = "en"
 
-# List of patterns, relative to source directory, that match files and
-# directories to ignore when looking for source files.
-# This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = ["_build", "**.ipynb_checkpoints"]
-
 # The name of the Pygments (syntax highlighting) style to use.
 pygments_style = "colorful"
 
@@ -187,19 +189,20 @@ if os.getenv("EXPERIMENTS_DEV_DOCS", None):
 """
 
 
+# Versions listed in the version switcher, computed once from the current release
+_START_VERSION = (0, 5, 0)
+_VERSION_INFO = tuple(release.split("."))
+if _VERSION_INFO[0] == "0":
+    _VERSION_LIST = tuple("0.%s" % x for x in range(_START_VERSION[1], int(_VERSION_INFO[1])))
+else:
+    # TODO: When 1.0.0 add code to handle 0.x version list
+    _VERSION_LIST = ()
+
+
 def _get_versions(app, config):
     context = config.html_context
-    start_version = (0, 5, 0)
-    current_version = release
-    current_version_info = current_version.split(".")
-    if current_version_info[0] == "0":
-        version_list = ["0.%s" % x for x in range(start_version[1], int(current_version_info[1]))]
-    else:
-        # TODO: When 1.0.0 add code to handle 0.x version list
-        version_list = []
-        pass
-    context["version_list"] = version_list
-    context["version_label"] = _get_version_label(current_version)
+    context["version_list"] = list(_VERSION_LIST)
+    context["version_label"] = _get_version_label(release)
 
 
 def _get_version_label(current_version):
@@ -217,12 +220,8 @@ def setup(app):
 # Hardcoded list of class variables to skip in autodoc to avoid warnings
 # Should come up with better way to address this
 
-from qiskit_experiments.curve_analysis import ParameterRepr
-from qiskit_experiments.curve_analysis import SeriesDef
-
-
-def maybe_skip_member(app, what, name, obj, skip, options):
-    skip_names = [
+_SKIP_NAMES = frozenset(
+    {
         "analysis",
         "set_run_options",
         "data_allocation",
@@ -235,15 +234,36 @@ def maybe_skip_member(app, what, name, obj, skip, options):
         "filter_kwargs",
         "fit_func",
         "signature",
-    ]
-    skip_members = [
-        ParameterRepr.repr,
-        ParameterRepr.unit,
-        SeriesDef.plot_color,
-        SeriesDef.plot_symbol,
-        SeriesDef.model_description,
-        SeriesDef.canvas,
-    ]
-    if not skip:
-        return (name in skip_names or obj in skip_members) and what == "attribute"
-    return skip
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _skip_members():
+    # Imported on first use so that loading conf.py doesn't import qiskit_experiments
+    from qiskit_experiments.curve_analysis import ParameterRepr, SeriesDef
+
+    return frozenset(
+        {
+            ParameterRepr.repr,
+            ParameterRepr.unit,
+            SeriesDef.plot_color,
+            SeriesDef.plot_symbol,
+            SeriesDef.model_description,
+            SeriesDef.canvas,
+        }
+    )
+
+
+def _is_skip_member(obj):
+    try:
+        return obj in _skip_members()
+    except TypeError:
+        # Unhashable class attributes never match the hardcoded members
+        return False
+
+
+def maybe_skip_member(app, what, name, obj, skip, options):
+    if skip or what != "attribute":
+        return skip
+    return name in _SKIP_NAMES or _is_skip_member(obj)
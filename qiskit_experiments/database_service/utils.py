@@ -19,6 +19,8 @@ import traceback
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import Callable, Tuple, Dict, Any, Union, Type, Optional
 import json
 
@@ -40,6 +42,16 @@ LOG = logging.getLogger(__name__)
 
 def qiskit_version():
     """Return the Qiskit version."""
+    version = _qiskit_version()
+    if isinstance(version, dict):
+        # Don't hand out the cached dictionary itself
+        return version.copy()
+    return version
+
+
+@lru_cache(maxsize=1)
+def _qiskit_version():
+    """Look up the Qiskit version, which can't change during the process lifetime."""
     try:
         return pkg_resources.get_distribution("qiskit").version
     except Exception:  # pylint: disable=broad-except
@@ -242,7 +254,10 @@ class ThreadSafeOrderedDict(ThreadSafeContainer):
     """Thread safe OrderedDict."""
 
     def _init_container(self, init_values):
-        """Initialize the container."""
+        """Initialize the container.
+
+        The keys in ``init_values`` are inserted in bulk with ``None`` values.
+        """
         return OrderedDict.fromkeys(init_values or [])
 
     def get(self, key, default):
@@ -255,14 +270,46 @@ class ThreadSafeOrderedDict(ThreadSafeContainer):
         with self._lock:
             return list(self._container.keys())
 
+    def key_at(self, index):
+        """Return the key at the given position, counting from the end if negative.
+
+        Unlike indexing into :meth:`keys`, this walks the keys in place instead of
+        copying all of them into a list first.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        with self._lock:
+            if index < 0:
+                keys, index = reversed(self._container), -index - 1
+            else:
+                keys = iter(self._container)
+            try:
+                return next(islice(keys, index, None))
+            except StopIteration:
+                raise IndexError("index out of range") from None
+
     def values(self):
         """Return all values."""
         with self._lock:
             return list(self._container.values())
 
     def items(self):
-        """Return the key value pairs."""
-        return self._container.items()
+        """Return the key value pairs.
+
+        The pairs are copied while holding the lock, so they can be iterated
+        over without blocking writers or being invalidated by them.
+        """
+        with self._lock:
+            return list(self._container.items())
+
+    def update(self, other):
+        """Update the dictionary with the key value pairs from ``other``.
+
+        All pairs are inserted under a single lock acquisition.
+        """
+        with self._lock:
+            self._container.update(other)
 
 
 class ThreadSafeList(ThreadSafeContainer):
@@ -276,3 +323,8 @@ class ThreadSafeList(ThreadSafeContainer):
         """Append to the list."""
         with self._lock:
             self._container.append(value)
+
+    def extend(self, values):
+        """Extend the list with all the given values at once."""
+        with self._lock:
+            self._container.extend(values)
@@ -16,7 +16,6 @@ import copy
 import logging
 import math
 import uuid
-import traceback
 from typing import Optional, List, Union, Dict, Any
 
 import uncertainties
@@ -228,7 +227,7 @@ class AnalysisResult:
             self._created_in_db = True
         except Exception as ex:  # pylint: disable=broad-except
             # Don't automatically fail the experiment just because its data cannot be saved.
-            LOG.error("Unable to save the experiment data: %s", traceback.format_exc())
+            LOG.error("Unable to save the experiment data.", exc_info=True)
             if not suppress_errors:
                 raise QiskitError(f"Analysis result save failed\nError Message:\n{str(ex)}") from ex
 
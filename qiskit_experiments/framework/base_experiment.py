@@ -416,6 +416,8 @@ class BaseExperiment(ABC, StoreInitArgs):
 
         By default, this assumes the experiment is running on qubits only. Subclasses can override
         this method to add custom experiment metadata to the returned experiment result data.
+        Implementations must return newly built containers on each call, since
+        :class:`.ExperimentData` stores the returned values without deep-copying them.
         """
         metadata = {
             "physical_qubits": list(self.physical_qubits),
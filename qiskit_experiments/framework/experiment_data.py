@@ -19,20 +19,19 @@ import dataclasses
 from typing import Dict, Optional, List, Union, Any, Callable, Tuple, TYPE_CHECKING
 from datetime import datetime, timezone
 from concurrent import futures
-from threading import Event
-from functools import wraps
+from threading import Event, Lock
+from functools import lru_cache, wraps
 from collections import deque
 import contextlib
+import contextvars
 import copy
 import uuid
 import enum
 import time
 import io
-import sys
+import json
 import traceback
-import numpy as np
-from dateutil import tz
-from matplotlib import pyplot
+import weakref
 from matplotlib.figure import Figure as MatplotlibFigure
 from qiskit.result import Result
 from qiskit.providers.jobstatus import JobStatus, JOB_FINAL_STATES
@@ -66,6 +65,50 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 
+# Experiments whose metadata save is pending until the outermost
+# ``ExperimentData._defer_metadata_saves`` context of the current thread exits
+_DEFERRED_METADATA_SAVES = contextvars.ContextVar("_deferred_metadata_saves", default=None)
+
+
+def _set_event_when_done(futs: List[futures.Future], event: Event) -> None:
+    """Set ``event`` once all the futures in ``futs`` are done."""
+    if not futs:
+        event.set()
+        return
+    remaining = len(futs)
+    lock = Lock()
+
+    def _future_done(_):
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining:
+                return
+        event.set()
+
+    for fut in futs:
+        fut.add_done_callback(_future_done)
+
+
+# Formatted tracebacks of exceptions raised by job and analysis futures, so that
+# repeatedly checking the errors of an experiment doesn't format them every time
+_FORMATTED_EXCEPTIONS = weakref.WeakKeyDictionary()
+_FORMATTED_EXCEPTIONS_LOCK = Lock()
+
+
+def _format_exception(ex: BaseException) -> str:
+    """Return the formatted traceback of ``ex``."""
+    with _FORMATTED_EXCEPTIONS_LOCK:
+        try:
+            text = _FORMATTED_EXCEPTIONS.get(ex)
+        except TypeError:
+            # Exceptions that define __eq__ without __hash__ can't be cached
+            return "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
+        if text is None:
+            text = "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
+            _FORMATTED_EXCEPTIONS[ex] = text
+    return text
+
 
 def do_auto_save(func: Callable):
     """Decorate the input function to auto save data."""
@@ -80,6 +123,18 @@ def do_auto_save(func: Callable):
     return _wrapped
 
 
+@lru_cache(maxsize=None)
+def _local_timezone():
+    """Return the local timezone.
+
+    ``dateutil`` is imported here rather than at module level since it is only
+    needed when converting timestamps for display.
+    """
+    from dateutil import tz
+
+    return tz.tzlocal()
+
+
 def utc_to_local(utc_dt: datetime) -> datetime:
     """Convert input UTC timestamp to local timezone.
 
@@ -91,8 +146,10 @@ def utc_to_local(utc_dt: datetime) -> datetime:
     """
     if utc_dt is None:
         return None
-    local_dt = utc_dt.astimezone(tz.tzlocal())
-    return local_dt
+    local_tz = _local_timezone()
+    if utc_dt.tzinfo is local_tz:
+        return utc_dt
+    return utc_dt.astimezone(local_tz)
 
 
 def local_to_utc(local_dt: datetime) -> datetime:
@@ -106,8 +163,9 @@ def local_to_utc(local_dt: datetime) -> datetime:
     """
     if local_dt is None:
         return None
-    utc_dt = local_dt.astimezone(tz.UTC)
-    return utc_dt
+    if local_dt.tzinfo is timezone.utc:
+        return local_dt
+    return local_dt.astimezone(timezone.utc)
 
 
 def parse_utc_datetime(dt_str: str) -> datetime:
@@ -115,12 +173,42 @@ def parse_utc_datetime(dt_str: str) -> datetime:
     if dt_str is None:
         return None
 
+    if dt_str.endswith("Z"):
+        # Fast path for the database format, parsed in C by fromisoformat.
+        # It only accepts 3 or 6 fractional digits before Python 3.11.
+        try:
+            return datetime.fromisoformat(dt_str[:-1] + "+00:00")
+        except ValueError:
+            pass
+
     db_datetime_format = "%Y-%m-%dT%H:%M:%S.%fZ"
     dt_utc = datetime.strptime(dt_str, db_datetime_format)
     dt_utc = dt_utc.replace(tzinfo=timezone.utc)
     return dt_utc
 
 
+_IMMUTABLE_TYPES = (str, int, float, complex, bool, bytes, type(None))
+
+
+def _fast_clone(obj: Any) -> Any:
+    """Return a deep copy of JSON-like data.
+
+    Plain dicts, lists and tuples are rebuilt recursively and immutable values are
+    returned as is, which avoids the memo bookkeeping of :func:`copy.deepcopy`.
+    Any other type falls back to :func:`copy.deepcopy`.
+    """
+    obj_type = type(obj)
+    if obj_type in _IMMUTABLE_TYPES:
+        return obj
+    if obj_type is dict:
+        return {key: _fast_clone(val) for key, val in obj.items()}
+    if obj_type is list:
+        return [_fast_clone(val) for val in obj]
+    if obj_type is tuple:
+        return tuple(_fast_clone(val) for val in obj)
+    return copy.deepcopy(obj)
+
+
 class FigureData:
     """Wrapper class for figures and figure metadata. The raw figure can be accessed with
     the ``figure`` attribute."""
@@ -157,7 +245,17 @@ class FigureData:
     def copy(self, new_name: Optional[str] = None):
         """Creates a copy of the figure data"""
         name = new_name or self.name
-        return FigureData(figure=self.figure, name=name, metadata=copy.deepcopy(self.metadata))
+        return FigureData(figure=self.figure, name=name, metadata=_fast_clone(self.metadata))
+
+    def _svg_bytes(self):
+        """Return the figure in the format it is saved to the database in.
+
+        Matplotlib figures are rendered to SVG on every call, since they may have
+        been modified in place since they were last saved.
+        """
+        if isinstance(self.figure, MatplotlibFigure):
+            return plot_to_svg_bytes(self.figure)
+        return self.figure
 
     def __json_encode__(self) -> Dict[str, Any]:
         """Return the json representation of the figure data"""
@@ -171,7 +269,10 @@ class FigureData:
     def _repr_png_(self):
         if isinstance(self.figure, MatplotlibFigure):
             b = io.BytesIO()
-            self.figure.savefig(b, format="png", bbox_inches="tight")
+            # Render with agg directly rather than through the figure's own canvas.
+            # The tight bounding box is kept since the default fit report textbox
+            # is drawn below the axes, outside of the figure area.
+            self.figure.savefig(b, format="png", bbox_inches="tight", backend="agg")
             png = b.getvalue()
             return png
         else:
@@ -210,6 +311,7 @@ class ExperimentData:
     """
 
     _metadata_version = 1
+    # Executor shared by all experiment data for the futures waiting on job results
     _job_executor = futures.ThreadPoolExecutor()
 
     _json_encoder = ExperimentEncoder
@@ -274,7 +376,9 @@ class ExperimentData:
         # data stored in the database
         metadata = {}
         if experiment is not None:
-            metadata = copy.deepcopy(experiment._metadata())
+            # ``_metadata()`` builds new containers on every call, so a shallow
+            # copy is enough to keep the experiment and this container independent.
+            metadata = dict(experiment._metadata())
         source = metadata.pop(
             "_source",
             {
@@ -324,14 +428,20 @@ class ExperimentData:
 
         # job handling related
         self._jobs = ThreadSafeOrderedDict(job_ids)
+        self._completion_times = {}
         self._job_futures = ThreadSafeOrderedDict()
+        # Job futures that are not done yet
+        self._pending_job_futures = set()
         self._analysis_callbacks = ThreadSafeOrderedDict()
         self._analysis_futures = ThreadSafeOrderedDict()
+        # IDs of analysis callbacks whose futures are not done yet
+        self._pending_analysis_ids = set()
         # Set 2 workers for analysis executor so there can be 1 actively running
         # future and one waiting "running" future. This is to allow the second
         # future to be cancelled without waiting for the actively running future
         # to finish first.
         self._analysis_executor = futures.ThreadPoolExecutor(max_workers=2)
+        # The monitor executor runs the add_jobs timeout watchers
         self._monitor_executor = futures.ThreadPoolExecutor()
 
         # data storage
@@ -364,8 +474,16 @@ class ExperimentData:
         """Returns the completion times of the jobs."""
         job_times = {}
         for job_id, job in self._jobs.items():
-            if job is not None and "COMPLETED" in job.time_per_step():
-                job_times[job_id] = job.time_per_step().get("COMPLETED")
+            if job is None:
+                continue
+            # The completion time of a job doesn't change once set, so each
+            # job is only queried until it has completed
+            if job_id not in self._completion_times:
+                time_per_step = job.time_per_step()
+                if "COMPLETED" not in time_per_step:
+                    continue
+                self._completion_times[job_id] = time_per_step["COMPLETED"]
+            job_times[job_id] = self._completion_times[job_id]
 
         return job_times
 
@@ -384,7 +502,7 @@ class ExperimentData:
         """Set tags for this experiment."""
         if not isinstance(new_tags, list):
             raise ExperimentDataError(f"The `tags` field of {type(self).__name__} must be a list.")
-        self._db_data.tags = np.unique(new_tags).tolist()
+        self._db_data.tags = list(dict.fromkeys(new_tags))
         if self.auto_save:
             self.save_metadata()
 
@@ -555,14 +673,12 @@ class ExperimentData:
                 specified. For example, IBM Quantum experiment service allows
                 "public", "hub", "group", "project", and "private".
         """
-        self._db_data.share_level = new_level
-        for data in self._child_data.values():
-            original_auto_save = data.auto_save
-            data.auto_save = False
-            data.share_level = new_level
-            data.auto_save = original_auto_save
-        if self.auto_save:
-            self.save_metadata()
+        with self._defer_metadata_saves():
+            self._db_data.share_level = new_level
+            for data in self._child_data.values():
+                data.share_level = new_level
+            if self.auto_save:
+                self.save_metadata()
 
     @property
     def notes(self) -> str:
@@ -609,16 +725,23 @@ class ExperimentData:
         if self.auto_save:
             self.save_metadata()
 
-    def _set_backend(self, new_backend: Backend, recursive: bool = True) -> None:
+    def _set_backend(
+        self,
+        new_backend: Backend,
+        recursive: bool = True,
+        backend_data: Optional[BackendData] = None,
+    ) -> None:
         """Set backend.
         Args:
             new_backend: New backend.
             recursive: should set the backend for children as well
+            backend_data: Optional, an already built :class:`.BackendData` for
+                ``new_backend``. This lets children reuse the parent's wrapper.
         """
         # defined independently from the setter to enable setting without autosave
 
         self._backend = new_backend
-        self._backend_data = BackendData(new_backend)
+        self._backend_data = backend_data or BackendData(new_backend)
         self._db_data.backend = self._backend_data.name
         if self._db_data.backend is None:
             self._db_data.backend = str(new_backend)
@@ -627,9 +750,12 @@ class ExperimentData:
             self._set_hgp_from_provider(provider)
         if recursive:
             for data in self.child_data():
-                data._set_backend(new_backend)
+                data._set_backend(new_backend, backend_data=self._backend_data)
 
     def _set_hgp_from_provider(self, provider):
+        if self._db_data.hub and self._db_data.group and self._db_data.project:
+            # Existing values are never overwritten, so there is nothing to look up
+            return
         try:
             hub = None
             group = None
@@ -755,7 +881,7 @@ class ExperimentData:
         Raises:
             TypeError: If the input data type is invalid.
         """
-        if any(not future.done() for future in self._analysis_futures.values()):
+        if self._pending_analysis_ids:
             LOG.warning(
                 "Not all analysis has finished running. Adding new data may "
                 "create unexpected analysis results."
@@ -795,7 +921,7 @@ class ExperimentData:
             If you want to wait for jobs without cancelling, use the timeout
             kwarg of :meth:`block_for_results` instead.
         """
-        if any(not future.done() for future in self._analysis_futures.values()):
+        if self._pending_analysis_ids:
             LOG.warning(
                 "Not all analysis has finished running. Adding new jobs may "
                 "create unexpected analysis results."
@@ -803,41 +929,58 @@ class ExperimentData:
         if isinstance(jobs, Job):
             jobs = [jobs]
 
-        # Add futures for extracting finished job data
-        timeout_ids = []
+        # Jobs usually share a backend, so resolve each backend's name only once
+        job_backend_names = {}
+        new_jobs = {}
         for job in jobs:
-            if self.backend is not None:
-                backend_name = BackendData(self.backend).name
-                job_backend_name = BackendData(job.backend()).name
-                if self.backend and backend_name != job_backend_name:
-                    LOG.warning(
-                        "Adding a job from a backend (%s) that is different "
-                        "than the current backend (%s). "
-                        "The new backend will be used, but "
-                        "service is not changed if one already exists.",
-                        job.backend(),
-                        self.backend,
-                    )
-            self.backend = job.backend()
+            job_backend = job.backend()
+            if id(job_backend) not in job_backend_names:
+                job_backend_names[id(job_backend)] = BackendData(job_backend).name
+            job_backend_name = job_backend_names[id(job_backend)]
+            if self.backend and self._backend_data.name != job_backend_name:
+                LOG.warning(
+                    "Adding a job from a backend (%s) that is different "
+                    "than the current backend (%s). "
+                    "The new backend will be used, but "
+                    "service is not changed if one already exists.",
+                    job_backend,
+                    self.backend,
+                )
+            # Adopt the job backend even if the name matches, since the backend
+            # provider may only be known to the backend object of the job.
+            # Only the reassignment of the very same object is skipped.
+            if self._backend is not job_backend:
+                self.backend = job_backend
 
             jid = job.job_id()
-            if jid in self._jobs:
+            if jid in self._jobs or jid in new_jobs:
                 LOG.warning(
                     "Skipping duplicate job, a job with this ID already exists [Job ID: %s]", jid
                 )
             else:
-                self.job_ids.append(jid)
-                self._jobs[jid] = job
-                if jid in self._job_futures:
-                    LOG.warning("Job future has already been submitted [Job ID: %s]", jid)
-                else:
-                    self._add_job_future(job)
-                    if timeout is not None:
-                        timeout_ids.append(jid)
+                new_jobs[jid] = job
+
+        # Record all new jobs at once so concurrent callers only contend for
+        # the job container lock a single time per call
+        with self._jobs.lock:
+            self._jobs.update(new_jobs)
+            self.job_ids.extend(new_jobs)
+
+        # Add futures for extracting finished job data
+        timeout_ids = []
+        for jid, job in new_jobs.items():
+            if jid in self._job_futures:
+                LOG.warning("Job future has already been submitted [Job ID: %s]", jid)
+            else:
+                self._add_job_future(job)
+                if timeout is not None:
+                    timeout_ids.append(jid)
 
-        # Add future for cancelling jobs that timeout
+        # Add future for cancelling jobs that timeout. This runs on the monitor
+        # executor so that waiting on the job futures doesn't occupy a worker of
+        # the shared job executor the job futures themselves are queued on.
         if timeout_ids:
-            self._job_executor.submit(self._timeout_running_jobs, timeout_ids, timeout)
+            self._monitor_executor.submit(self._timeout_running_jobs, timeout_ids, timeout)
 
         if self.auto_save:
             self.save_metadata()
@@ -867,7 +1010,13 @@ class ExperimentData:
         if jid in self._job_futures:
             LOG.warning("Job future has already been submitted [Job ID: %s]", jid)
         else:
-            self._job_futures[jid] = self._job_executor.submit(self._add_job_data, job)
+            job_future = self._job_executor.submit(self._add_job_data, job)
+            self._job_futures[jid] = job_future
+            # Track the future itself since a job ID can be submitted again once
+            # its previous future was cleaned up. The callback runs right away
+            # if the future is already done.
+            self._pending_job_futures.add(job_future)
+            job_future.add_done_callback(self._pending_job_futures.discard)
 
     def _add_job_data(
         self,
@@ -889,8 +1038,9 @@ class ExperimentData:
             job_result = job.result()
             self._add_result_data(job_result, jid)
             LOG.debug("Job data added [Job ID: %s]", jid)
-            # sets the endtime to be the time the last successful job was added
-            self.end_datetime = datetime.now()
+            # sets the endtime to be the time the last successful job was added.
+            # Taking the current time in UTC avoids a local timezone round trip.
+            self._db_data.end_datetime = datetime.now(timezone.utc)
             return jid, True
         except Exception as ex:  # pylint: disable=broad-except
             # Handle cancelled jobs
@@ -925,56 +1075,56 @@ class ExperimentData:
                       keywork arguments passed to this method.
             **kwargs: Keyword arguments to be passed to the callback function.
         """
-        with self._job_futures.lock and self._analysis_futures.lock:
-            # Create callback dataclass
-            cid = uuid.uuid4().hex
-            self._analysis_callbacks[cid] = AnalysisCallback(
-                name=callback.__name__,
-                callback_id=cid,
-            )
+        # Create callback dataclass. This doesn't touch shared state, so it is
+        # done before taking the lock to keep the critical section short.
+        cid = uuid.uuid4().hex
+        callback_status = AnalysisCallback(
+            name=callback.__name__,
+            callback_id=cid,
+        )
+
+        with self._job_futures.lock, self._analysis_futures.lock:
+            self._analysis_callbacks[cid] = callback_status
 
             # Futures to wait for
             futs = self._job_futures.values() + self._analysis_futures.values()
-            wait_future = self._monitor_executor.submit(
-                self._wait_for_futures, futs, name="jobs and analysis"
-            )
-
-            # Create a future to monitor event for calls to cancel_analysis
-            def _monitor_cancel():
-                self._analysis_callbacks[cid].event.wait()
-                return False
-
-            cancel_future = self._monitor_executor.submit(_monitor_cancel)
 
             # Add run analysis future
-            self._analysis_futures[cid] = self._analysis_executor.submit(
-                self._run_analysis_callback, cid, wait_future, cancel_future, callback, **kwargs
+            analysis_future = self._analysis_executor.submit(
+                self._run_analysis_callback, cid, futs, callback, **kwargs
             )
+            self._analysis_futures[cid] = analysis_future
+            # Track pending callbacks so guards don't need to poll every future
+            self._pending_analysis_ids.add(cid)
+            analysis_future.add_done_callback(lambda _: self._pending_analysis_ids.discard(cid))
 
     def _run_analysis_callback(
         self,
         callback_id: str,
-        wait_future: futures.Future,
-        cancel_future: futures.Future,
+        futs: List[futures.Future],
         callback: Callable,
         **kwargs,
     ):
         """Run an analysis callback after specified futures have finished."""
         if callback_id not in self._analysis_callbacks:
             raise ValueError(f"No analysis callback with id {callback_id}")
-
-        # Monitor jobs and cancellation event to see if callback should be run
-        # or cancelled
-        # Future which returns if either all jobs finish, or cancel event is set
-        waited = futures.wait([wait_future, cancel_future], return_when="FIRST_COMPLETED")
-        cancel = not all(fut.result() for fut in waited.done)
-
-        # Ensure monitor event is set so monitor future can terminate
-        self._analysis_callbacks[callback_id].event.set()
+        callback_status = self._analysis_callbacks[callback_id]
+
+        # The callback event is set either by cancel_analysis or by done callbacks
+        # once all the jobs and prior analysis being waited on finish, so no
+        # monitor thread is needed. The callback is only run if the futures
+        # finished first and all of them succeeded.
+        event = callback_status.event
+        _set_event_when_done(futs, event)
+        event.wait()
+        cancel = not (
+            all(fut.done() for fut in futs)
+            and self._wait_for_futures(futs, name="jobs and analysis")
+        )
 
         # If not ready cancel the callback before running
         if cancel:
-            self._analysis_callbacks[callback_id].status = AnalysisStatus.CANCELLED
+            callback_status.status = AnalysisStatus.CANCELLED
             LOG.info(
                 "Cancelled analysis callback [Experiment ID: %s][Analysis Callback ID: %s]",
                 self.experiment_id,
@@ -983,16 +1133,16 @@ class ExperimentData:
             return callback_id, False
 
         # Run callback function
-        self._analysis_callbacks[callback_id].status = AnalysisStatus.RUNNING
+        callback_status.status = AnalysisStatus.RUNNING
         try:
             LOG.debug(
                 "Running analysis callback '%s' [Experiment ID: %s][Analysis Callback ID: %s]",
-                self._analysis_callbacks[callback_id].name,
+                callback_status.name,
                 self.experiment_id,
                 callback_id,
             )
             callback(self, **kwargs)
-            self._analysis_callbacks[callback_id].status = AnalysisStatus.DONE
+            callback_status.status = AnalysisStatus.DONE
             LOG.debug(
                 "Analysis callback finished [Experiment ID: %s][Analysis Callback ID: %s]",
                 self.experiment_id,
@@ -1000,13 +1150,13 @@ class ExperimentData:
             )
             return callback_id, True
         except Exception as ex:  # pylint: disable=broad-except
-            self._analysis_callbacks[callback_id].status = AnalysisStatus.ERROR
+            callback_status.status = AnalysisStatus.ERROR
             tb_text = "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
             error_msg = (
                 f"Analysis callback failed [Experiment ID: {self.experiment_id}]"
                 f"[Analysis Callback ID: {callback_id}]:\n{tb_text}"
             )
-            self._analysis_callbacks[callback_id].error_msg = error_msg
+            callback_status.error_msg = error_msg
             LOG.warning(error_msg)
             return callback_id, False
 
@@ -1023,22 +1173,22 @@ class ExperimentData:
         if job_id not in self._jobs:
             self._jobs[job_id] = None
             self.job_ids.append(job_id)
-        with self._result_data.lock:
-            # Lock data while adding all result data
-            for i, _ in enumerate(result.results):
-                data = result.data(i)
-                data["job_id"] = job_id
-                if "counts" in data:
-                    # Format to Counts object rather than hex dict
-                    data["counts"] = result.get_counts(i)
-                expr_result = result.results[i]
-                if hasattr(expr_result, "header") and hasattr(expr_result.header, "metadata"):
-                    data["metadata"] = expr_result.header.metadata
-                data["shots"] = expr_result.shots
-                data["meas_level"] = expr_result.meas_level
-                if hasattr(expr_result, "meas_return"):
-                    data["meas_return"] = expr_result.meas_return
-                self._result_data.append(data)
+        # Format all result data first so the data lock is only held to add it
+        new_data = []
+        for i, expr_result in enumerate(result.results):
+            data = result.data(i)
+            data["job_id"] = job_id
+            if "counts" in data:
+                # Format to Counts object rather than hex dict
+                data["counts"] = result.get_counts(i)
+            if hasattr(expr_result, "header") and hasattr(expr_result.header, "metadata"):
+                data["metadata"] = expr_result.header.metadata
+            data["shots"] = expr_result.shots
+            data["meas_level"] = expr_result.meas_level
+            if hasattr(expr_result, "meas_return"):
+                data["meas_return"] = expr_result.meas_return
+            new_data.append(data)
+        self._result_data.extend(new_data)
 
     def _retrieve_data(self):
         """Retrieve job data if missing experiment data."""
@@ -1048,25 +1198,36 @@ class ExperimentData:
         retrieved_jobs = {}
         jobs_to_retrieve = []  # the list of all jobs to retrieve from the server
 
-        # first find which jobs are listed in the `job_ids` field of the experiment data
+        # first find which jobs are listed in the `job_ids` field of the experiment data.
+        # This runs on every data() call, so check against a single snapshot of the
+        # jobs rather than locking the container twice per job.
         if self.job_ids is not None:
-            for jid in self.job_ids:
-                if jid not in self._jobs or self._jobs[jid] is None:
-                    jobs_to_retrieve.append(jid)
+            jobs = self._jobs.copy()
+            jobs_to_retrieve = [jid for jid in self.job_ids if jobs.get(jid) is None]
 
-        for jid in jobs_to_retrieve:
+        def _retrieve_job(jid):
             try:
                 LOG.debug("Retrieving job [Job ID: %s]", jid)
-                job = self.provider.retrieve_job(jid)
-                retrieved_jobs[jid] = job
+                return self.provider.retrieve_job(jid)
             except Exception:  # pylint: disable=broad-except
                 LOG.warning(
                     "Unable to retrieve data from job [Job ID: %s]",
                     jid,
                 )
+                return None
+
+        # Each retrieval is a round trip to the server, so run them concurrently
+        if jobs_to_retrieve:
+            max_workers = min(len(jobs_to_retrieve), self._max_workers_cap)
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for jid, job in zip(
+                    jobs_to_retrieve, executor.map(_retrieve_job, jobs_to_retrieve)
+                ):
+                    if job is not None:
+                        retrieved_jobs[jid] = job
         # Add retrieved job objects to stored jobs and extract data
+        self._jobs.update(retrieved_jobs)
         for jid, job in retrieved_jobs.items():
-            self._jobs[jid] = job
             if job.status() in JOB_FINAL_STATES:
                 # Add job results synchronously
                 self._add_job_data(job)
@@ -1115,7 +1276,7 @@ class ExperimentData:
         """Add the experiment figure.
 
         Args:
-            figures (str or bytes or pyplot.Figure or list): Paths of the figure
+            figures (str or bytes or matplotlib.figure.Figure or list): Paths of the figure
                 files or figure data.
             figure_names (str or list): Names of the figures. If ``None``, use the figure file
                 names, if given, or a generated name. If `figures` is a list, then
@@ -1144,17 +1305,23 @@ class ExperimentData:
                 "the same size as the parameter figures."
             )
 
+        save = save_figure if save_figure is not None else self.auto_save
+        save = save and self._service
         added_figs = []
+        # New figures are uploaded together once all of them are added. If adding
+        # a figure fails, none of the new figures are uploaded here.
+        figures_to_create = {}
+        # Loop invariants for generated names and figure metadata. The figure count
+        # is tracked locally as figures are added instead of re-reading it each time.
+        exp_suffix = f"Exp-{self.experiment_id[:8]}.svg"
+        num_figures = len(self._figures)
+        qubits = self.metadata.get("physical_qubits")
         for idx, figure in enumerate(figures):
             if figure_names is None:
                 if isinstance(figure, str):
                     fig_name = figure
                 else:
-                    fig_name = (
-                        f"{self.experiment_type}_"
-                        f"Fig-{len(self._figures)}_"
-                        f"Exp-{self.experiment_id[:8]}.svg"
-                    )
+                    fig_name = f"{self.experiment_type}_Fig-{num_figures}_{exp_suffix}"
             else:
                 fig_name = figure_names[idx]
 
@@ -1174,30 +1341,48 @@ class ExperimentData:
                 with open(figure, "rb") as file:
                     figure = file.read()
 
-            # check whether the figure is already wrapped, meaning it came from a sub-experiment
+            # check whether the figure is already wrapped, meaning it came from a
+            # sub-experiment
             if isinstance(figure, FigureData):
                 figure_data = figure.copy(new_name=fig_name)
                 figure = figure_data.figure
 
             else:
-                figure_metadata = {"qubits": self.metadata.get("physical_qubits")}
+                figure_metadata = {"qubits": qubits}
                 figure_data = FigureData(figure=figure, name=fig_name, metadata=figure_metadata)
 
             self._figures[fig_name] = figure_data
             self._db_data.figure_names.append(fig_name)
+            if not existing_figure:
+                num_figures += 1
 
-            save = save_figure if save_figure is not None else self.auto_save
-            if save and self._service:
-                if isinstance(figure, pyplot.Figure):
-                    figure = plot_to_svg_bytes(figure)
+            if save and existing_figure and fig_name not in figures_to_create:
                 self._service.create_or_update_figure(
                     experiment_id=self.experiment_id,
-                    figure=figure,
+                    figure=figure_data._svg_bytes(),
                     figure_name=fig_name,
-                    create=not existing_figure,
+                    create=False,
                 )
+            elif save:
+                figures_to_create[fig_name] = figure_data._svg_bytes()
             added_figs.append(fig_name)
 
+        if len(figures_to_create) == 1:
+            fig_name, figure = figures_to_create.popitem()
+            self._service.create_or_update_figure(
+                experiment_id=self.experiment_id,
+                figure=figure,
+                figure_name=fig_name,
+                create=True,
+            )
+        elif figures_to_create:
+            self._service.create_figures(
+                experiment_id=self.experiment_id,
+                figure_list=[(figure, name) for name, figure in figures_to_create.items()],
+                blocking=True,
+                max_workers=min(len(figures_to_create), self._max_workers_cap),
+            )
+
         return added_figs if len(added_figs) != 1 else added_figs[0]
 
     @do_auto_save
@@ -1217,7 +1402,7 @@ class ExperimentData:
             ExperimentEntryNotFound: If the figure is not found.
         """
         if isinstance(figure_key, int):
-            figure_key = self._figures.keys()[figure_key]
+            figure_key = self._figures.key_at(figure_key)
         elif figure_key not in self._figures:
             raise ExperimentEntryNotFound(f"Figure {figure_key} not found.")
 
@@ -1251,9 +1436,9 @@ class ExperimentData:
             ExperimentEntryNotFound: If the figure cannot be found.
         """
         if isinstance(figure_key, int):
-            if figure_key < 0 or figure_key >= len(self._figures.keys()):
+            if figure_key < 0 or figure_key >= len(self._figures):
                 raise ExperimentEntryNotFound(f"Figure {figure_key} not found.")
-            figure_key = self._figures.keys()[figure_key]
+            figure_key = self._figures.key_at(figure_key)
 
         figure_data = self._figures.get(figure_key, None)
         if figure_data is None and self.service:
@@ -1311,7 +1496,7 @@ class ExperimentData:
         """
 
         if isinstance(result_key, int):
-            result_key = self._analysis_results.keys()[result_key]
+            result_key = self._analysis_results.key_at(result_key)
         else:
             # Retrieve from DB if needed.
             result_key = self.analysis_results(result_key, block=False).result_id
@@ -1338,12 +1523,13 @@ class ExperimentData:
             retrieved_results = self.service.analysis_results(
                 experiment_id=self.experiment_id, limit=None, json_decoder=self._json_decoder
             )
+            new_results = {}
             for result in retrieved_results:
-                result_id = result.result_id
-
-                self._analysis_results[result_id] = AnalysisResult(service=self.service)
-                self._analysis_results[result_id].set_data(result)
-                self._analysis_results[result_id]._created_in_db = True
+                analysis_result = AnalysisResult(service=self.service)
+                analysis_result.set_data(result)
+                analysis_result._created_in_db = True
+                new_results[result.result_id] = analysis_result
+            self._analysis_results.update(new_results)
 
     def analysis_results(
         self,
@@ -1391,9 +1577,12 @@ class ExperimentData:
             return "\n".join(msg)
 
         if isinstance(index, int):
-            if index >= len(self._analysis_results.values()):
+            # Check and index the same snapshot, so a result added or removed in
+            # between can't make the bounds check stale
+            results = self._analysis_results.values()
+            if index >= len(results):
                 raise ExperimentEntryNotFound(_make_not_found_message(index))
-            return self._analysis_results.values()[index]
+            return results[index]
         if isinstance(index, slice):
             results = self._analysis_results.values()[index]
             if not results:
@@ -1428,10 +1617,36 @@ class ExperimentData:
             See :meth:`qiskit.providers.experiment.IBMExperimentService.create_experiment`
             for fields that are saved.
         """
-        self._save_experiment_metadata()
+        pending = _DEFERRED_METADATA_SAVES.get()
+        if pending is None:
+            self._save_experiment_metadata()
+        else:
+            pending.setdefault(id(self), self)
         for data in self.child_data():
             data.save_metadata()
 
+    @contextlib.contextmanager
+    def _defer_metadata_saves(self):
+        """Context manager that coalesces metadata saves.
+
+        Calls to :meth:`save_metadata` made in this context, on this or any other
+        experiment data, are recorded instead of being sent to the service. Each
+        recorded experiment is saved once when the outermost context exits, so
+        recursive updates don't save the same experiment repeatedly.
+        """
+        if _DEFERRED_METADATA_SAVES.get() is not None:
+            # The outermost context flushes the pending saves
+            yield
+            return
+        pending = {}
+        token = _DEFERRED_METADATA_SAVES.set(pending)
+        try:
+            yield
+        finally:
+            _DEFERRED_METADATA_SAVES.reset(token)
+            for data in pending.values():
+                data._save_experiment_metadata()
+
     def _save_experiment_metadata(self, suppress_errors: bool = True) -> None:
         """Save this experiments metadata to a database service.
         Args:
@@ -1478,14 +1693,17 @@ class ExperimentData:
 
         except Exception as ex:  # pylint: disable=broad-except
             # Don't automatically fail the experiment just because its data cannot be saved.
-            LOG.error("Unable to save the experiment data: %s", traceback.format_exc())
+            # Let the logging handler format the traceback only if the record is emitted
+            LOG.error("Unable to save the experiment data.", exc_info=True)
             if not suppress_errors:
                 raise QiskitError(f"Experiment data save failed\nError Message:\n{str(ex)}") from ex
 
     def _metadata_too_large(self):
         """Determines whether the metadata should be stored in a separate file"""
-        # currently the entire POST JSON request body is limited by default to 100kb
-        return sys.getsizeof(self.metadata) > 10000
+        # currently the entire POST JSON request body is limited by default to 100kb.
+        # A one-shot dumps uses the C accelerated encoder, which is faster than
+        # encoding chunk by chunk with iterencode even when that stops early.
+        return len(json.dumps(self.metadata, cls=self._json_encoder)) > 10000
 
     def save(
         self,
@@ -1552,16 +1770,18 @@ class ExperimentData:
                 result._created_in_db = True
         except Exception as ex:  # pylint: disable=broad-except
             # Don't automatically fail the experiment just because its data cannot be saved.
-            LOG.error("Unable to save the experiment data: %s", traceback.format_exc())
+            LOG.error("Unable to save the experiment data.", exc_info=True)
             if not suppress_errors:
                 raise ExperimentDataSaveFailed(
                     f"Analysis result save failed\nError Message:\n{str(ex)}"
                 ) from ex
 
-        for result in self._deleted_analysis_results.copy():
+        # Drain from the left so each entry is popped in O(1) instead of copying
+        # the queue and removing entries one by one with repeated scans
+        while self._deleted_analysis_results:
+            result = self._deleted_analysis_results.popleft()
             with service_exception_to_warning():
                 self._service.delete_analysis_result(result_id=result)
-            self._deleted_analysis_results.remove(result)
 
         if save_figures:
             with self._figures.lock:
@@ -1571,9 +1791,9 @@ class ExperimentData:
                         continue
                     # currently only the figure and its name are stored in the database
                     if isinstance(figure, FigureData):
-                        figure = figure.figure
+                        figure = figure._svg_bytes()
                         LOG.debug("Figure metadata is currently not saved to the database")
-                    if isinstance(figure, pyplot.Figure):
+                    elif isinstance(figure, MatplotlibFigure):
                         figure = plot_to_svg_bytes(figure)
                     figures_to_create.append((figure, name))
                 self.service.create_figures(
@@ -1583,10 +1803,10 @@ class ExperimentData:
                     max_workers=max_workers,
                 )
 
-        for name in self._deleted_figures.copy():
+        while self._deleted_figures:
+            name = self._deleted_figures.popleft()
             with service_exception_to_warning():
                 self._service.delete_figure(experiment_id=self.experiment_id, figure_name=name)
-            self._deleted_figures.remove(name)
 
         if not self.service.local and self.verbose:
             print(
@@ -1594,16 +1814,34 @@ class ExperimentData:
                 f"https://quantum-computing.ibm.com/experiments/{self.experiment_id}"
             )
         # handle children, but without additional prints
-        if save_children:
-            for data in self._child_data.values():
+        if save_children and self._child_data:
+
+            def _save_child(data, child_max_workers):
                 original_verbose = data.verbose
                 data.verbose = False
-                data.save(
-                    suppress_errors=suppress_errors,
-                    max_workers=max_workers,
-                    save_figures=save_figures,
-                )
-                data.verbose = original_verbose
+                try:
+                    data.save(
+                        suppress_errors=suppress_errors,
+                        max_workers=child_max_workers,
+                        save_figures=save_figures,
+                    )
+                finally:
+                    data.verbose = original_verbose
+
+            child_data = self._child_data.values()
+            if self.service.local:
+                # The local service updates its tables without locking, so it
+                # can't take concurrent saves
+                for data in child_data:
+                    _save_child(data, max_workers)
+            else:
+                # The children already run concurrently, so each one saves its own
+                # entries with a single worker to keep the total thread count bounded
+                with futures.ThreadPoolExecutor(
+                    max_workers=min(len(child_data), max_workers)
+                ) as executor:
+                    # Consume the results so that errors raised by a child save propagate
+                    list(executor.map(_save_child, child_data, [1] * len(child_data)))
 
     def jobs(self) -> List[Job]:
         """Return a list of jobs for the experiment"""
@@ -1624,6 +1862,7 @@ class ExperimentData:
 
         with self._jobs.lock:
             all_cancelled = True
+            finished_ids = []
             for jid, job in reversed(self._jobs.items()):
                 if ids and jid not in ids:
                     # Skip cancelling this callback
@@ -1637,9 +1876,13 @@ class ExperimentData:
                         LOG.warning("Unable to cancel job [Job ID: %s]:\n%s", jid, err)
                         continue
 
-                # Remove done or cancelled job futures
-                if jid in self._job_futures:
-                    del self._job_futures[jid]
+                finished_ids.append(jid)
+
+            # Remove done or cancelled job futures in one pass under their lock
+            with self._job_futures.lock:
+                for jid in finished_ids:
+                    if jid in self._job_futures:
+                        del self._job_futures[jid]
 
         return all_cancelled
 
@@ -1684,11 +1927,30 @@ class ExperimentData:
                 else:
                     not_running.append(cid)
 
+            pending = []
+            for cid in not_running:
+                fut = self._analysis_futures.get(cid, None)
+                if fut is None:
+                    continue
+                if fut.cancel():
+                    # The callback never started, e.g. because it was queued behind a
+                    # running one, so there is nothing to wait for
+                    self._analysis_callbacks[cid].status = AnalysisStatus.CANCELLED
+                    del self._analysis_futures[cid]
+                    LOG.info(
+                        "Cancelled analysis callback [Experiment ID: %s]"
+                        "[Analysis Callback ID: %s]",
+                        self.experiment_id,
+                        cid,
+                    )
+                else:
+                    pending.append(fut)
+
             # Wait for completion of other futures cancelled via event.set
-            waited = futures.wait([self._analysis_futures[cid] for cid in not_running], timeout=1)
+            waited = futures.wait(pending, timeout=1)
             # Get futures that didn't raise exception
             for fut in waited.done:
-                if fut.done() and not fut.exception():
+                if not fut.cancelled() and not fut.exception():
                     cid = fut.result()[0]
                     if cid in self._analysis_futures:
                         del self._analysis_futures[cid]
@@ -1720,43 +1982,43 @@ class ExperimentData:
         Returns:
             The experiment data with finished jobs and post-processing.
         """
-        start_time = time.time()
-        with self._job_futures.lock and self._analysis_futures.lock:
-            # Lock threads to get all current job and analysis futures
-            # at the time of function call and then release the lock
-            job_ids = self._job_futures.keys()
-            job_futs = self._job_futures.values()
-            analysis_ids = self._analysis_futures.keys()
-            analysis_futs = self._analysis_futures.values()
-
-        # Wait for futures
-        self._wait_for_futures(job_futs + analysis_futs, name="jobs and analysis", timeout=timeout)
-        # Clean up done job futures
-        num_jobs = len(job_ids)
-        for jid, fut in zip(job_ids, job_futs):
-            if (fut.done() and not fut.exception()) or fut.cancelled():
-                if jid in self._job_futures:
-                    del self._job_futures[jid]
-                    num_jobs -= 1
-
-        # Clean up done analysis futures
-        num_analysis = len(analysis_ids)
-        for cid, fut in zip(analysis_ids, analysis_futs):
-            if (fut.done() and not fut.exception()) or fut.cancelled():
-                if cid in self._analysis_futures:
-                    del self._analysis_futures[cid]
-                    num_analysis -= 1
+        # Keep waiting until no more futures get added while waiting. This could
+        # happen if an analysis callback spawns another callback or creates more jobs
+        while True:
+            start_time = time.time()
+            with self._job_futures.lock, self._analysis_futures.lock:
+                # Lock threads to get all current job and analysis futures
+                # at the start of this round and then release the lock
+                job_futs = self._job_futures.items()
+                analysis_futs = self._analysis_futures.items()
+
+            # Wait for futures
+            self._wait_for_futures(
+                [fut for _, fut in job_futs + analysis_futs],
+                name="jobs and analysis",
+                timeout=timeout,
+            )
+            # Clean up done job futures
+            num_jobs = len(job_futs)
+            for jid, fut in job_futs:
+                if fut.cancelled() or (fut.done() and not fut.exception()):
+                    if jid in self._job_futures:
+                        del self._job_futures[jid]
+                        num_jobs -= 1
+
+            # Clean up done analysis futures
+            num_analysis = len(analysis_futs)
+            for cid, fut in analysis_futs:
+                if fut.cancelled() or (fut.done() and not fut.exception()):
+                    if cid in self._analysis_futures:
+                        del self._analysis_futures[cid]
+                        num_analysis -= 1
 
-        # Check if more futures got added while this function was running
-        # and block recursively. This could happen if an analysis callback
-        # spawns another callback or creates more jobs
-        if len(self._job_futures) > num_jobs or len(self._analysis_futures) > num_analysis:
-            time_taken = time.time() - start_time
-            if timeout is not None:
-                timeout = max(0, timeout - time_taken)
-            return self.block_for_results(timeout=timeout)
+            if len(self._job_futures) <= num_jobs and len(self._analysis_futures) <= num_analysis:
+                return self
 
-        return self
+            if timeout is not None:
+                timeout = max(0, timeout - (time.time() - start_time))
 
     def _wait_for_futures(
         self, futs: List[futures.Future], name: str = "futures", timeout: Optional[float] = None
@@ -1785,27 +2047,36 @@ class ExperimentData:
             )
             value = False
 
-        # Check for futures that were cancelled or errored
-        excepts = ""
+        # Check for futures that were cancelled or errored. The tracebacks are
+        # only collected for the error log, so skip them if it won't be emitted.
+        log_errors = LOG.isEnabledFor(logging.ERROR)
+        excepts = []
         for fut in waited.done:
-            ex = fut.exception()
-            if ex:
-                excepts += "\n".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
-                value = False
-            elif fut.cancelled():
+            # Check for cancellation first since exception() and result() raise
+            # CancelledError for cancelled futures
+            if fut.cancelled():
                 LOG.debug(
                     "%s was cancelled before completion [Experiment ID: %s]",
                     name,
                     self.experiment_id,
                 )
                 value = False
+                continue
+            ex = fut.exception()
+            if ex:
+                if log_errors:
+                    excepts.append(_format_exception(ex))
+                value = False
             elif not fut.result()[1]:
                 # The job/analysis did not succeed, and the failure reflects in the second
                 # returned value of _add_job_data/_run_analysis_callback. See details in Issue #866.
                 value = False
         if excepts:
             LOG.error(
-                "%s raised exceptions [Experiment ID: %s]:%s", name, self.experiment_id, excepts
+                "%s raised exceptions [Experiment ID: %s]:\n%s",
+                name,
+                self.experiment_id,
+                "\n".join(excepts),
             )
 
         return value
@@ -1849,27 +2120,14 @@ class ExperimentData:
             return ExperimentStatus.EMPTY
 
         # Return job status is job is not DONE
-        try:
-            return {
-                JobStatus.INITIALIZING: ExperimentStatus.INITIALIZING,
-                JobStatus.QUEUED: ExperimentStatus.QUEUED,
-                JobStatus.VALIDATING: ExperimentStatus.VALIDATING,
-                JobStatus.RUNNING: ExperimentStatus.RUNNING,
-                JobStatus.CANCELLED: ExperimentStatus.CANCELLED,
-                JobStatus.ERROR: ExperimentStatus.ERROR,
-            }[self.job_status()]
-        except KeyError:
-            pass
+        status = _JOB_TO_EXPERIMENT_STATUS.get(self.job_status())
+        if status is not None:
+            return status
 
         # Return analysis status if Done, cancelled or error
-        try:
-            return {
-                AnalysisStatus.DONE: ExperimentStatus.DONE,
-                AnalysisStatus.CANCELLED: ExperimentStatus.CANCELLED,
-                AnalysisStatus.ERROR: ExperimentStatus.ERROR,
-            }[self.analysis_status()]
-        except KeyError:
-            return ExperimentStatus.POST_PROCESSING
+        return _ANALYSIS_TO_EXPERIMENT_STATUS.get(
+            self.analysis_status(), ExperimentStatus.POST_PROCESSING
+        )
 
     def job_status(self) -> JobStatus:
         """Return the experiment job execution status.
@@ -1893,17 +2151,22 @@ class ExperimentData:
         Returns:
             The job execution status.
         """
-        statuses = set()
-        with self._jobs.lock:
+        # Querying a job status can be a round trip to the provider, so only hold
+        # the lock while taking the snapshot to not block jobs being added
+        jobs = self._jobs.values()
 
-            # No jobs present
-            if not self._jobs:
-                return JobStatus.DONE
+        # No jobs present
+        if not jobs:
+            return JobStatus.DONE
 
-            statuses = set()
-            for job in self._jobs.values():
-                if job:
-                    statuses.add(job.status())
+        statuses = set()
+        for job in jobs:
+            if job:
+                status = job.status()
+                if status == JobStatus.ERROR:
+                    # No status takes precedence over an error
+                    return status
+                statuses.add(status)
 
         # If any jobs are in non-DONE state return that state
         for stat in [
@@ -1933,9 +2196,7 @@ class ExperimentData:
         Returns:
             Then analysis status.
         """
-        statuses = set()
-        for status in self._analysis_callbacks.values():
-            statuses.add(status.status)
+        statuses = {callback.status for callback in self._analysis_callbacks.values()}
 
         for stat in [
             AnalysisStatus.ERROR,
@@ -1963,12 +2224,10 @@ class ExperimentData:
 
         # Get any job futures errors:
         for jid, fut in self._job_futures.items():
-            if fut and fut.done() and fut.exception():
+            if fut and fut.done() and not fut.cancelled():
                 ex = fut.exception()
-                errors.append(
-                    f"[Job ID: {jid}]"
-                    "\n".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
-                )
+                if ex:
+                    errors.append(f"\n[Job ID: {jid}]: {_format_exception(ex)}")
         return "".join(errors)
 
     def analysis_errors(self) -> str:
@@ -2025,7 +2284,11 @@ class ExperimentData:
         """
         if index is None:
             return self._child_data.values()
-        if isinstance(index, (int, slice)):
+        if isinstance(index, int):
+            # Look up the single child in place instead of copying all of them
+            with self._child_data.lock:
+                return self._child_data[self._child_data.key_at(index)]
+        if isinstance(index, slice):
             return self._child_data.values()[index]
         if isinstance(index, str):
             return self._child_data[index]
@@ -2073,9 +2336,19 @@ class ExperimentData:
         expdata._created_in_db = True
 
         child_data_ids = expdata.metadata.pop("child_data_ids", [])
-        child_data = [
-            ExperimentData.load(child_id, service, provider) for child_id in child_data_ids
-        ]
+        child_data = []
+        if child_data_ids:
+            # Each child is loaded with its own round trips to the service, so load
+            # them concurrently. map keeps the children in their original order.
+            with futures.ThreadPoolExecutor(
+                max_workers=min(len(child_data_ids), cls._max_workers_cap)
+            ) as executor:
+                child_data = list(
+                    executor.map(
+                        lambda child_id: ExperimentData.load(child_id, service, provider),
+                        child_data_ids,
+                    )
+                )
         expdata._set_child_data(child_data)
 
         return expdata
@@ -2157,9 +2430,12 @@ class ExperimentData:
 
     def _set_child_data(self, child_data: List[ExperimentData]):
         """Set child experiment data for the current experiment."""
-        self._child_data = ThreadSafeOrderedDict()
+        # Add all the children at once instead of through add_child_data, which
+        # would republish the list of child IDs after every single child
         for data in child_data:
-            self.add_child_data(data)
+            data.parent_id = self.experiment_id
+        self._child_data = ThreadSafeOrderedDict()
+        self._child_data.update((data.experiment_id, data) for data in child_data)
         self._db_data.metadata["child_data_ids"] = self._child_data.keys()
 
     def _set_service(self, service: IBMExperimentService, replace: bool = None) -> None:
@@ -2190,9 +2466,10 @@ class ExperimentData:
         Args:
             tags2add - the tags that will be added to the existing tags
         """
-        self.tags += tags2add
-        for data in self._child_data.values():
-            data.add_tags_recursive(tags2add)
+        with self._defer_metadata_saves():
+            self.tags += tags2add
+            for data in self._child_data.values():
+                data.add_tags_recursive(tags2add)
 
     def remove_tags_recursive(self, tags2remove: List[str]) -> None:
         """Remove tags from this experiment itself and its descendants
@@ -2200,72 +2477,76 @@ class ExperimentData:
         Args:
             tags2remove - the tags that will be removed from the existing tags
         """
-        self.tags = [x for x in self.tags if x not in tags2remove]
-        for data in self._child_data.values():
-            data.remove_tags_recursive(tags2remove)
+        # Use a set for constant time membership tests; the children get the same set
+        if not isinstance(tags2remove, (set, frozenset)):
+            tags2remove = frozenset(tags2remove)
+        with self._defer_metadata_saves():
+            self.tags = [x for x in self.tags if x not in tags2remove]
+            for data in self._child_data.values():
+                data.remove_tags_recursive(tags2remove)
 
     # represetnation and serialization
 
     def __repr__(self):
-        out = f"{type(self).__name__}({self.experiment_type}"
-        out += f", {self.experiment_id}"
+        parts = [f"{type(self).__name__}({self.experiment_type}", f", {self.experiment_id}"]
         if self.parent_id:
-            out += f", parent_id={self.parent_id}"
+            parts.append(f", parent_id={self.parent_id}")
         if self.tags:
-            out += f", tags={self.tags}"
+            parts.append(f", tags={self.tags}")
         if self.job_ids:
-            out += f", job_ids={self.job_ids}"
+            parts.append(f", job_ids={self.job_ids}")
         if self.share_level:
-            out += f", share_level={self.share_level}"
+            parts.append(f", share_level={self.share_level}")
         if self.metadata:
-            out += f", metadata=<{len(self.metadata)} items>"
+            parts.append(f", metadata=<{len(self.metadata)} items>")
         if self.figure_names:
-            out += f", figure_names={self.figure_names}"
+            parts.append(f", figure_names={self.figure_names}")
         if self.notes:
-            out += f", notes={self.notes}"
-        if self._extra_data:
-            for key, val in self._extra_data.items():
-                out += f", {key}={repr(val)}"
-        out += ")"
-        return out
+            parts.append(f", notes={self.notes}")
+        parts.extend(f", {key}={repr(val)}" for key, val in self._extra_data.items())
+        parts.append(")")
+        return "".join(parts)
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return self._extra_data[name]
-        except KeyError:
-            # pylint: disable=raise-missing-from
-            raise AttributeError(f"Attribute {name} is not defined")
+        # Read the extra data from the instance dict so that a lookup before it is
+        # set, e.g. while unpickling, doesn't recurse back into this method
+        extra_data = self.__dict__.get("_extra_data")
+        if extra_data is not None and name in extra_data:
+            return extra_data[name]
+        raise AttributeError(f"Attribute {name} is not defined")
 
     def _safe_serialize_jobs(self):
         """Return serializable object for stored jobs"""
         # Since Job objects are not serializable this removes
         # them from the jobs dict and returns {job_id: None}
         # that can be used to retrieve jobs from a service after loading
-        jobs = ThreadSafeOrderedDict()
-        with self._jobs.lock:
-            for jid in self._jobs.keys():
-                jobs[jid] = None
-        return jobs
+        return ThreadSafeOrderedDict(self._jobs.keys())
 
     def _safe_serialize_figures(self):
         """Return serializable object for stored figures"""
         # Convert any MPL figures into SVG images before serializing
         figures = ThreadSafeOrderedDict()
         with self._figures.lock:
-            for name, figure in self._figures.items():
-                if isinstance(figure, pyplot.Figure):
-                    figures[name] = plot_to_svg_bytes(figure)
-                else:
-                    figures[name] = figure
+            figures.update(
+                (
+                    name,
+                    plot_to_svg_bytes(figure) if isinstance(figure, MatplotlibFigure) else figure,
+                )
+                for name, figure in self._figures.items()
+            )
         return figures
 
     def __json_encode__(self):
-        if any(not fut.done() for fut in self._job_futures.values()):
+        # Futures are only dropped from the pending sets after they are done, so
+        # only check the futures themselves while some are still listed as pending
+        if self._pending_job_futures and any(not fut.done() for fut in self._job_futures.values()):
             raise QiskitError(
                 "Not all experiment jobs have finished. Jobs must be "
                 "cancelled or done to serialize experiment data."
             )
-        if any(not fut.done() for fut in self._analysis_futures.values()):
+        if self._pending_analysis_ids and any(
+            not fut.done() for fut in self._analysis_futures.values()
+        ):
             raise QiskitError(
                 "Not all experiment analysis has finished. Analysis must be "
                 "cancelled or done to serialize experiment data."
@@ -2303,12 +2584,14 @@ class ExperimentData:
         return ret
 
     def __getstate__(self):
-        if any(not fut.done() for fut in self._job_futures.values()):
+        if self._pending_job_futures and any(not fut.done() for fut in self._job_futures.values()):
             LOG.warning(
                 "Not all job futures have finished."
                 " Data from running futures will not be serialized."
             )
-        if any(not fut.done() for fut in self._analysis_futures.values()):
+        if self._pending_analysis_ids and any(
+            not fut.done() for fut in self._analysis_futures.values()
+        ):
             LOG.warning(
                 "Not all analysis callbacks have finished."
                 " Results from running callbacks will not be serialized."
@@ -2317,7 +2600,14 @@ class ExperimentData:
         state = self.__dict__.copy()
 
         # Remove non-pickleable attributes
-        for key in ["_job_futures", "_analysis_futures", "_analysis_executor", "_monitor_executor"]:
+        for key in [
+            "_job_futures",
+            "_pending_job_futures",
+            "_analysis_futures",
+            "_pending_analysis_ids",
+            "_analysis_executor",
+            "_monitor_executor",
+        ]:
             del state[key]
 
         # Convert figures to SVG
@@ -2353,32 +2643,37 @@ class ExperimentData:
         self.__dict__.update(state)
         # Initialize non-pickled attributes
         self._job_futures = ThreadSafeOrderedDict()
+        self._pending_job_futures = set()
         self._analysis_futures = ThreadSafeOrderedDict()
-        self._analysis_executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_analysis_ids = set()
+        # Same worker count as in __init__ so that a queued callback can still be
+        # cancelled while another one is running
+        self._analysis_executor = futures.ThreadPoolExecutor(max_workers=2)
+        self._monitor_executor = futures.ThreadPoolExecutor()
 
     def __str__(self):
-        line = 51 * "-"
         n_res = len(self._analysis_results)
         status = self.status()
-        ret = line
-        ret += f"\nExperiment: {self.experiment_type}"
-        ret += f"\nExperiment ID: {self.experiment_id}"
+        lines = [
+            51 * "-",
+            f"Experiment: {self.experiment_type}",
+            f"Experiment ID: {self.experiment_id}",
+        ]
         if self._db_data.parent_id:
-            ret += f"\nParent ID: {self._db_data.parent_id}"
+            lines.append(f"Parent ID: {self._db_data.parent_id}")
         if self._child_data:
-            ret += f"\nChild Experiment Data: {len(self._child_data)}"
-        ret += f"\nStatus: {status}"
+            lines.append(f"Child Experiment Data: {len(self._child_data)}")
+        lines.append(f"Status: {status}")
         if status == "ERROR":
-            ret += "\n  "
-            ret += "\n  ".join(self._errors)
+            lines.append("  " + "\n  ".join(self._errors))
         if self.backend:
-            ret += f"\nBackend: {self.backend}"
+            lines.append(f"Backend: {self.backend}")
         if self.tags:
-            ret += f"\nTags: {self.tags}"
-        ret += f"\nData: {len(self._result_data)}"
-        ret += f"\nAnalysis Results: {n_res}"
-        ret += f"\nFigures: {len(self._figures)}"
-        return ret
+            lines.append(f"Tags: {self.tags}")
+        lines.append(f"Data: {len(self._result_data)}")
+        lines.append(f"Analysis Results: {n_res}")
+        lines.append(f"Figures: {len(self._figures)}")
+        return "\n".join(lines)
 
 
 @contextlib.contextmanager
@@ -2390,7 +2685,18 @@ def service_exception_to_warning():
         LOG.warning("Experiment service operation failed: %s", traceback.format_exc())
 
 
-class ExperimentStatus(enum.Enum):
+class _JsonEnum(enum.Enum):
+    """Base class for enumerated types that are serialized by member name."""
+
+    def __json_encode__(self):
+        return self.name
+
+    @classmethod
+    def __json_decode__(cls, value):
+        return cls[value]  # pylint: disable=unsubscriptable-object
+
+
+class ExperimentStatus(_JsonEnum):
     """Class for experiment status enumerated type."""
 
     EMPTY = "experiment data is empty"
@@ -2403,15 +2709,8 @@ class ExperimentStatus(enum.Enum):
     DONE = "experiment jobs and analysis have successfully run"
     ERROR = "experiment jobs or analysis incurred an error"
 
-    def __json_encode__(self):
-        return self.name
-
-    @classmethod
-    def __json_decode__(cls, value):
-        return cls.__members__[value]  # pylint: disable=unsubscriptable-object
 
-
-class AnalysisStatus(enum.Enum):
+class AnalysisStatus(_JsonEnum):
     """Class for analysis callback status enumerated type."""
 
     QUEUED = "analysis callback is queued"
@@ -2420,12 +2719,22 @@ class AnalysisStatus(enum.Enum):
     DONE = "analysis callback has successfully run"
     ERROR = "analysis callback incurred an error"
 
-    def __json_encode__(self):
-        return self.name
 
-    @classmethod
-    def __json_decode__(cls, value):
-        return cls.__members__[value]  # pylint: disable=unsubscriptable-object
+# Experiment status reported for the job statuses that take precedence over the
+# analysis status, and for the analysis statuses that end the post-processing
+_JOB_TO_EXPERIMENT_STATUS = {
+    JobStatus.INITIALIZING: ExperimentStatus.INITIALIZING,
+    JobStatus.QUEUED: ExperimentStatus.QUEUED,
+    JobStatus.VALIDATING: ExperimentStatus.VALIDATING,
+    JobStatus.RUNNING: ExperimentStatus.RUNNING,
+    JobStatus.CANCELLED: ExperimentStatus.CANCELLED,
+    JobStatus.ERROR: ExperimentStatus.ERROR,
+}
+_ANALYSIS_TO_EXPERIMENT_STATUS = {
+    AnalysisStatus.DONE: ExperimentStatus.DONE,
+    AnalysisStatus.CANCELLED: ExperimentStatus.CANCELLED,
+    AnalysisStatus.ERROR: ExperimentStatus.ERROR,
+}
 
 
 @dataclasses.dataclass
@@ -2440,10 +2749,15 @@ class AnalysisCallback:
 
     def __getstate__(self):
         # We need to remove the Event object from state when pickling
-        # since events are not pickleable
-        state = self.__dict__
-        state["event"] = None
+        # since events are not pickleable. The state is copied so that
+        # pickling doesn't drop the event of this instance.
+        state = self.__dict__.copy()
+        del state["event"]
         return state
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.event = Event()
+
     def __json_encode__(self):
         return self.__getstate__()
@@ -179,8 +179,7 @@ def _serialize_and_encode(
     """
     with io.BytesIO() as buff:
         serializer(buff, data, **kwargs)
-        buff.seek(0)
-        serialized_data = buff.read()
+        serialized_data = buff.getvalue()
     return _serialize_bytes(serialized_data, compress=compress)
 
 
@@ -199,9 +198,7 @@ def _decode_and_deserialize(value: Dict, deserializer: Callable, name: Optional[
         ValueError: If deserialization fails.
     """
     try:
-        with io.BytesIO() as buff:
-            buff.write(value)
-            buff.seek(0)
+        with io.BytesIO(value) as buff:
             orig = deserializer(buff)
         return orig
     except Exception as ex:  # pylint: disable=broad-except
@@ -21,9 +21,11 @@ from random import randrange
 import time
 import threading
 import json
+import pickle
 import re
 import uuid
-from datetime import datetime, timedelta
+from concurrent import futures
+from datetime import datetime, timedelta, timezone
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -36,7 +38,8 @@ from qiskit_ibm_experiment import IBMExperimentService
 from qiskit_experiments.framework import ExperimentData
 from qiskit_experiments.framework import AnalysisResult
 from qiskit_experiments.framework import BackendData
-from qiskit_experiments.framework.experiment_data import local_to_utc
+from qiskit_experiments.framework import FigureData
+from qiskit_experiments.framework.experiment_data import local_to_utc, parse_utc_datetime
 from qiskit_experiments.database_service.exceptions import (
     ExperimentDataError,
     ExperimentEntryNotFound,
@@ -44,6 +47,7 @@ from qiskit_experiments.database_service.exceptions import (
 )
 from qiskit_experiments.database_service.device_component import Qubit
 from qiskit_experiments.framework.experiment_data import (
+    AnalysisCallback,
     AnalysisStatus,
     ExperimentStatus,
 )
@@ -140,6 +144,51 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(expected, [sdata["counts"] for sdata in exp_data.data()])
         self.assertIn(a_job.job_id(), exp_data.job_ids)
 
+    def test_completion_times(self):
+        """Test job completion times are only queried until the job completed."""
+        completed_time = datetime.now()
+        job = mock.create_autospec(Job, instance=True)
+        job.job_id.return_value = "1234"
+        job.result.return_value = self._get_job_result(1)
+        job.status.return_value = JobStatus.DONE
+        job.time_per_step = mock.Mock(return_value={})
+
+        exp_data = ExperimentData(experiment_type="qiskit_test")
+        exp_data.add_jobs(job)
+        self.assertExperimentDone(exp_data)
+        self.assertEqual(exp_data.completion_times, {})
+
+        job.time_per_step.return_value = {"COMPLETED": completed_time}
+        self.assertEqual(exp_data.completion_times, {"1234": completed_time})
+        self.assertEqual(exp_data.completion_times, {"1234": completed_time})
+        self.assertEqual(job.time_per_step.call_count, 2)
+
+    def test_retrieve_jobs(self):
+        """Test retrieving missing jobs from the provider."""
+        jobs = {}
+        for jid in ["job1", "job2"]:
+            job = mock.create_autospec(Job, instance=True)
+            job.job_id.return_value = jid
+            job.result.return_value = self._get_job_result(1)
+            job.status.return_value = JobStatus.DONE
+            jobs[jid] = job
+
+        def _retrieve_job(jid):
+            if jid not in jobs:
+                raise ValueError(f"Unknown job {jid}")
+            return jobs[jid]
+
+        provider = mock.MagicMock()
+        provider.retrieve_job.side_effect = _retrieve_job
+        exp_data = ExperimentData(experiment_type="qiskit_test", job_ids=["job1", "bad", "job2"])
+        exp_data.provider = provider
+
+        with self.assertLogs("qiskit_experiments.framework.experiment_data", "WARNING"):
+            exp_data._retrieve_data()
+        self.assertEqual(provider.retrieve_job.call_count, 3)
+        self.assertEqual(len(exp_data.data()), 2)
+        self.assertEqual([sdata["job_id"] for sdata in exp_data.data()], ["job1", "job2"])
+
     def test_add_data_job_callback(self):
         """Test add job data with callback."""
 
@@ -376,6 +425,79 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         with self.assertRaises(ValueError):
             figure_data.metadata = ["foo", "bar"]
 
+    def test_copy_figure_metadata(self):
+        """Test copying figure data doesn't share nested metadata."""
+        figure_data = FigureData(
+            "hello", name="fig", metadata={"qubits": [0, 1], "fit": {"params": (1.0, [2.0])}}
+        )
+        figure_copy = figure_data.copy("fig_copy")
+        self.assertEqual(figure_copy.name, "fig_copy")
+        self.assertEqual(figure_copy.metadata, figure_data.metadata)
+
+        figure_copy.metadata["qubits"].append(2)
+        figure_copy.metadata["fit"]["params"][1].append(3.0)
+        self.assertEqual(figure_data.metadata["qubits"], [0, 1])
+        self.assertEqual(figure_data.metadata["fit"]["params"], (1.0, [2.0]))
+
+    def test_add_figures_save_batched(self):
+        """Test adding several figures with saving uploads the new ones together."""
+        hello_bytes = [str.encode("hello world"), str.encode("hello friend")]
+        service = self._set_mock_service()
+        exp_data = ExperimentData(
+            backend=self.backend, experiment_type="qiskit_test", service=service
+        )
+        exp_data.add_figures(hello_bytes[0], "existing.svg")
+        exp_data.add_figures(
+            hello_bytes + [hello_bytes[1]],
+            ["new1.svg", "new2.svg", "existing.svg"],
+            overwrite=True,
+            save_figure=True,
+        )
+        service.create_figures.assert_called_once()
+        self.assertEqual(
+            service.create_figures.call_args[1]["figure_list"],
+            [(hello_bytes[0], "new1.svg"), (hello_bytes[1], "new2.svg")],
+        )
+        service.create_or_update_figure.assert_called_once()
+        _, kwargs = service.create_or_update_figure.call_args
+        self.assertEqual(kwargs["figure_name"], "existing.svg")
+        self.assertFalse(kwargs["create"])
+
+    def test_add_figures_save_error(self):
+        """Test no new figures are uploaded when adding one of them fails."""
+        hello_bytes = str.encode("hello world")
+        service = self._set_mock_service()
+        exp_data = ExperimentData(
+            backend=self.backend, experiment_type="qiskit_test", service=service
+        )
+        exp_data.add_figures(hello_bytes, "existing.svg")
+        with self.assertRaises(ExperimentEntryExists):
+            exp_data.add_figures(
+                [hello_bytes, hello_bytes, hello_bytes],
+                ["new1.svg", "new2.svg", "existing.svg"],
+                save_figure=True,
+            )
+        service.create_figures.assert_not_called()
+        service.create_or_update_figure.assert_not_called()
+
+    def test_save_figure_modified(self):
+        """Test a matplotlib figure modified in place is rendered again when saved."""
+        service = self._set_mock_service()
+        exp_data = ExperimentData(
+            backend=self.backend, experiment_type="qiskit_test", service=service
+        )
+        axis = get_non_gui_ax()
+        exp_data.add_figures(axis.get_figure(), save_figure=True)
+        exp_data.save()
+        figure_list = service.create_figures.call_args[1]["figure_list"]
+        self.assertIsInstance(figure_list[0][0], bytes)
+        self.assertNotIn(b"CHANGED", figure_list[0][0])
+
+        axis.set_title("CHANGED")
+        exp_data.save()
+        figure_list = service.create_figures.call_args[1]["figure_list"]
+        self.assertIn(b"CHANGED", figure_list[0][0])
+
     def test_add_figure_bad_input(self):
         """Test adding figures with bad input."""
         exp_data = ExperimentData(backend=self.backend, experiment_type="qiskit_test")
@@ -432,6 +554,16 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         with self.assertLogs("qiskit_experiments", "WARNING"):
             exp_data.add_jobs(a_job)
 
+    def test_same_name_backend(self):
+        """Test the job backend is adopted when it has the same name."""
+        exp_data = ExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        job_backend = FakeMelbourneV2()
+        self.assertIsNot(exp_data.backend, job_backend)
+        a_job = mock.create_autospec(Job, instance=True)
+        a_job.backend.return_value = job_backend
+        exp_data.add_jobs(a_job)
+        self.assertIs(exp_data.backend, job_backend)
+
     def test_add_get_analysis_result(self):
         """Test adding and getting analysis results."""
         exp_data = ExperimentData(experiment_type="qiskit_test")
@@ -497,6 +629,27 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         service.create_figures.assert_called_once()
         service.create_analysis_results.assert_called_once()
 
+    def test_save_children(self):
+        """Test saving experiment data saves all its children."""
+        service = mock.create_autospec(IBMExperimentService, instance=True)
+        service.local = False
+        exp_data = ExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        for _ in range(3):
+            exp_data.add_child_data(
+                ExperimentData(backend=self.backend, experiment_type="qiskit_test")
+            )
+        exp_data.service = service
+        exp_data.save()
+        saved_ids = [
+            args[0].experiment_id for args, _ in service.create_or_update_experiment.call_args_list
+        ]
+        self.assertCountEqual(
+            saved_ids, [exp_data.experiment_id] + exp_data.metadata["child_data_ids"]
+        )
+        # The children's verbosity is only turned off while they are being saved
+        for child in exp_data.child_data():
+            self.assertTrue(child.verbose)
+
     def test_save_delete(self):
         """Test saving all deletion."""
         exp_data = ExperimentData(backend=self.backend, experiment_type="qiskit_test")
@@ -550,6 +703,55 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
                     called.assert_called_once()
                 service.reset_mock()
 
+    def test_save_large_metadata(self):
+        """Test metadata is uploaded separately based on its encoded size."""
+        service = self._set_mock_service()
+        exp_data = ExperimentData(
+            backend=self.backend, experiment_type="qiskit_test", service=service
+        )
+        exp_data.metadata["foo"] = "bar"
+        exp_data.save_metadata()
+        service.file_upload.assert_not_called()
+
+        # A single long entry that only takes a few bytes in the dict itself
+        large_metadata = {"values": list(range(5000))}
+        exp_data.metadata.update(large_metadata)
+        exp_data.save_metadata()
+        service.file_upload.assert_called_once()
+        _, _, uploaded = service.file_upload.call_args[0]
+        self.assertEqual(uploaded["values"], large_metadata["values"])
+        self.assertEqual(exp_data.metadata["values"], large_metadata["values"])
+
+    def test_auto_save_recursive_metadata(self):
+        """Test recursive metadata updates save each experiment once."""
+        service = self._set_mock_service()
+        exp_data = ExperimentData(
+            backend=self.backend, experiment_type="qiskit_test", service=service
+        )
+        for _ in range(2):
+            exp_data.add_child_data(
+                ExperimentData(backend=self.backend, experiment_type="qiskit_test", service=service)
+            )
+        exp_data.auto_save = True
+        service.reset_mock()
+
+        subtests = [
+            (exp_data.add_tags_recursive, (["foo"],)),
+            (exp_data.remove_tags_recursive, (["foo"],)),
+            (setattr, (exp_data, "share_level", "hub")),
+        ]
+        for func, params in subtests:
+            with self.subTest(func=func):
+                func(*params)
+                saved_ids = [
+                    kwargs["experiment_id"] if "experiment_id" in kwargs else args[0].experiment_id
+                    for args, kwargs in service.create_or_update_experiment.call_args_list
+                ]
+                self.assertCountEqual(
+                    saved_ids, [exp_data.experiment_id] + exp_data.metadata["child_data_ids"]
+                )
+                service.reset_mock()
+
     def test_status_job_pending(self):
         """Test experiment status when job is pending."""
         job1 = mock.create_autospec(Job, instance=True)
@@ -659,6 +861,8 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(["foo"], exp_data.tags)
         exp_data.tags = ["bar"]
         self.assertEqual(["bar"], exp_data.tags)
+        exp_data.tags = ["foo", "bar", "foo"]
+        self.assertEqual(["foo", "bar"], exp_data.tags)
 
     def test_cancel_jobs(self):
         """Test canceling experiment jobs."""
@@ -807,6 +1011,43 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(exp_data.analysis_status(), AnalysisStatus.CANCELLED)
         self.assertEqual(exp_data.status(), ExperimentStatus.CANCELLED)
 
+    def test_block_for_results_cancelled_future(self):
+        """Test blocking for results clears cancelled futures."""
+        fut = futures.Future()
+        fut.cancel()
+        fut.set_running_or_notify_cancel()
+
+        exp_data = ExperimentData(experiment_type="qiskit_test")
+        exp_data._job_futures["1234"] = fut
+        self.assertFalse(exp_data._wait_for_futures([fut]))
+        exp_data.block_for_results()
+        self.assertEqual(len(exp_data._job_futures), 0)
+
+    def test_job_errors(self):
+        """Test job future errors are reported with their traceback."""
+        fut = futures.Future()
+        try:
+            raise ValueError("Kaboom!")
+        except ValueError as ex:
+            fut.set_exception(ex)
+
+        exp_data = ExperimentData(experiment_type="qiskit_test")
+        exp_data._job_futures["1234"] = fut
+        errors = exp_data.job_errors()
+        self.assertTrue(errors.startswith("\n[Job ID: 1234]: Traceback"))
+        self.assertEqual(errors.count("[Job ID: 1234]"), 1)
+        self.assertIn("ValueError: Kaboom!", errors)
+        self.assertEqual(exp_data.job_errors(), errors)
+
+    def test_pickle_analysis_callback(self):
+        """Test pickling an analysis callback doesn't drop its event."""
+        callback = AnalysisCallback(name="callback", callback_id="1234")
+        event = callback.event
+        unpickled = pickle.loads(pickle.dumps(callback))
+        self.assertIs(callback.event, event)
+        self.assertEqual(unpickled.callback_id, "1234")
+        self.assertIsInstance(unpickled.event, threading.Event)
+
     def test_add_jobs_timeout(self):
         """Test timeout kwarg of add_jobs"""
 
@@ -1114,3 +1355,18 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         metadata = {"_source": "source_data"}
         data._db_data.metadata = metadata
         self.assertEqual(data.source, "source_data")
+
+    def test_parse_utc_datetime(self):
+        """Test parsing UTC datetime strings returned by the database."""
+        expected = datetime(2023, 3, 1, 12, 34, 56, 123456, tzinfo=timezone.utc)
+        self.assertEqual(parse_utc_datetime("2023-03-01T12:34:56.123456Z"), expected)
+        self.assertEqual(
+            parse_utc_datetime("2023-03-01T12:34:56.12Z"), expected.replace(microsecond=120000)
+        )
+        # Timestamps without fractional seconds are accepted as well
+        self.assertEqual(
+            parse_utc_datetime("2023-03-01T12:34:56Z"), expected.replace(microsecond=0)
+        )
+        self.assertIsNone(parse_utc_datetime(None))
+        with self.assertRaises(ValueError):
+            parse_utc_datetime("2023-03-01")
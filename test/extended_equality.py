@@ -18,12 +18,15 @@ officially implement the equality dunder method.
 """
 
 import dataclasses
-from typing import Any, List, Union
+import functools
+import math
+import operator
+import threading
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import numpy as np
 import uncertainties
 from lmfit import Model
-from multimethod import multimethod
 from qiskit_experiments.curve_analysis.curve_data import CurveFitResult
 from qiskit_experiments.data_processing import DataAction, DataProcessor
 from qiskit_experiments.database_service.utils import (
@@ -66,29 +69,102 @@ def is_equivalent(
     Returns:
         True when two objects are equivalent.
     """
+    if data1 is data2:
+        # The same object is always equivalent to itself, skip the recursive check
+        return True
     if strict_type and type(data1) is not type(data2):
         return False
-    evaluated = _is_equivalent_dispatcher(
-        data1,
-        data2,
-        strict_type=strict_type,
-        numerical_precision=numerical_precision,
-    )
-    if not isinstance(evaluated, (bool, np.bool_)):
-        # When either one of input is numpy array type, it may broadcast equality check
-        # and return ndarray of dtype=bool. e.g. np.array([]) == 123
-        # The input values should not be equal in this case.
-        return False
-    return evaluated
+    kwargs = {"strict_type": strict_type, "numerical_precision": numerical_precision}
+    if getattr(_memo, "cache", None) is None:
+        # Top-level call. Memoized results are only kept until this call returns,
+        # so that object IDs in the cache keys always refer to live objects.
+        _memo.cache = {}
+        try:
+            return _is_equivalent_dispatcher(data1, data2, **kwargs)
+        finally:
+            _memo.cache = None
+    return _is_equivalent_dispatcher(data1, data2, **kwargs)
+
+
+# Handlers for the data types that need a custom equivalence check, together with
+# the types each of them accepts. A type is resolved to the first handler that
+# accepts it, and the resolved handler is cached per type.
+_HANDLER_TYPES: List[Tuple[Tuple[type, ...], Callable]] = []
+_HANDLERS: Dict[type, Callable] = {}
+
+
+def _register(*types: type) -> Callable:
+    """Register an equivalence check handler for the given data types."""
+
+    def _decorator(handler: Callable) -> Callable:
+        _HANDLER_TYPES.append((types, handler))
+        return handler
+
+    return _decorator
+
+
+# Results of the expensive handlers, keyed on the IDs of the compared objects.
+_memo = threading.local()
+
+
+def _memoized(handler: Callable) -> Callable:
+    """Cache the result of a handler for the duration of a top-level comparison."""
+
+    @functools.wraps(handler)
+    def _wrapper(data1, data2, **kwargs):
+        key = (id(data1), id(data2))
+        try:
+            return _memo.cache[key][-1]
+        except KeyError:
+            evaluated = handler(data1, data2, **kwargs)
+            # Keep the compared objects alive, so that their IDs can't be reused
+            # by temporary objects created later in the same comparison.
+            _memo.cache[key] = (data1, data2, evaluated)
+            return evaluated
+
+    return _wrapper
+
+
+def _resolve_handler(data_type: type) -> Callable:
+    """Return the equivalence check handler for a data type."""
+    try:
+        return _HANDLERS[data_type]
+    except KeyError:
+        pass
+    for types, handler in _HANDLER_TYPES:
+        if issubclass(data_type, types):
+            break
+    else:
+        handler = _check_objects
+    _HANDLERS[data_type] = handler
+    return handler
 
 
-@multimethod
 def _is_equivalent_dispatcher(
+    data1: Any,
+    data2: Any,
+    **kwargs,
+):
+    """Dispatch the equivalence check to the handler for the input types.
+
+    A custom handler is only used when both inputs resolve to it.
+    """
+    handler = _resolve_handler(type(data1))
+    if handler is not _resolve_handler(type(data2)):
+        handler = _check_objects
+    return handler(data1, data2, **kwargs)
+
+
+def _check_objects(
     data1: object,
     data2: object,
     **kwargs,
 ):
-    """Equality check finally falls into this function."""
+    """Equality check finally falls into this function.
+
+    This is the only handler that may evaluate to a non-boolean value,
+    so the other handlers' results are returned without a type check.
+    """
     if data1 is None and data2 is None:
         return True
     if dataclasses.is_dataclass(data1) and dataclasses.is_dataclass(data2):
@@ -99,22 +175,38 @@ def _is_equivalent_dispatcher(
             data2.__dict__,
             **kwargs,
         )
-    return data1 == data2
+    evaluated = data1 == data2
+    if not isinstance(evaluated, (bool, np.bool_)):
+        # When either one of input is numpy array type, it may broadcast equality check
+        # and return ndarray of dtype=bool. e.g. np.array([]) == 123
+        # The input values should not be equal in this case.
+        return False
+    return evaluated
 
 
-@_is_equivalent_dispatcher.register
+@_register(dict, ThreadSafeOrderedDict)
 def _check_dicts(
     data1: Union[dict, ThreadSafeOrderedDict],
     data2: Union[dict, ThreadSafeOrderedDict],
     **kwargs,
 ):
     """Check equality of dictionary which may involve Qiskit Experiments classes."""
-    if set(data1) != set(data2):
+    if len(data1) != len(data2):
         return False
-    return all(is_equivalent(data1[k], data2[k], **kwargs) for k in data1.keys())
+    if isinstance(data1, dict) and isinstance(data2, dict):
+        # Key views compare as sets without copying the keys
+        if data1.keys() != data2.keys():
+            return False
+    elif set(data1.keys()) != set(data2.keys()):
+        return False
+    for key, value1 in data1.items():
+        value2 = data2[key]
+        if value1 is not value2 and not is_equivalent(value1, value2, **kwargs):
+            return False
+    return True
 
 
-@_is_equivalent_dispatcher.register
+@_register(float, np.floating)
 def _check_floats(
     data1: Union[float, np.floating],
     data2: Union[float, np.floating],
@@ -123,19 +215,20 @@ def _check_floats(
     """Check equality of float.
 
     Both python built-in float and numpy floating subtypes can be compared.
-    This function also supports comparison of float("nan").
+    This function also supports comparison of float("nan"). As in ``np.isclose``,
+    infinities of the same sign are equal at any precision.
     """
-    if np.isnan(data1) and np.isnan(data2):
+    value1, value2 = float(data1), float(data2)
+    if math.isnan(value1) and math.isnan(value2):
         # Special case
         return True
 
     precision = kwargs.get("numerical_precision", 0.0)
-    if precision == 0.0:
-        return float(data1) == float(data2)
-    return np.isclose(np.abs(data1 - data2), 0.0, atol=precision)
+    # Check exact equality first, since the difference of equal infinities is nan
+    return value1 == value2 or abs(value1 - value2) <= precision
 
 
-@_is_equivalent_dispatcher.register
+@_register(int, np.integer)
 def _check_integer(
     data1: Union[int, np.integer],
     data2: Union[int, np.integer],
@@ -148,31 +241,96 @@ def _check_integer(
     return int(data1) == int(data2)
 
 
-@_is_equivalent_dispatcher.register
+@_register(list, tuple, np.ndarray, ThreadSafeList)
 def _check_sequences(
     data1: Union[list, tuple, np.ndarray, ThreadSafeList],
     data2: Union[list, tuple, np.ndarray, ThreadSafeList],
     **kwargs,
 ):
     """Check equality of sequence."""
+    if isinstance(data1, np.ndarray) and isinstance(data2, np.ndarray):
+        evaluated = _check_numeric_arrays(data1, data2, **kwargs)
+        if evaluated is not None:
+            return evaluated
     if len(data1) != len(data2):
         return False
-    return all(is_equivalent(e1, e2, **kwargs) for e1, e2 in zip(data1, data2))
+    for e1, e2 in zip(data1, data2):
+        if e1 is not e2 and not is_equivalent(e1, e2, **kwargs):
+            return False
+    return True
+
+
+def _check_numeric_arrays(
+    data1: np.ndarray,
+    data2: np.ndarray,
+    *,
+    strict_type: bool = True,
+    numerical_precision: float = 0.0,
+):
+    """Check equality of numeric arrays in a single vectorized operation.
+
+    Elements are compared in the same way as the scalar float and integer checks,
+    including the handling of nan and infinities.
+    This returns None when the arrays need to be compared element by element,
+    e.g. for object arrays or arrays of incompatible element types.
+    """
+    kind1, kind2 = data1.dtype.kind, data2.dtype.kind
+    if strict_type and data1.dtype.type is not data2.dtype.type:
+        return None
+    if data1.shape != data2.shape:
+        return False
+    if kind1 == "f" and kind2 == "f":
+        return bool(np.allclose(data1, data2, rtol=0.0, atol=numerical_precision, equal_nan=True))
+    if (kind1 in "iu" and kind2 in "iu") or (kind1 == "b" and kind2 == "b"):
+        return bool((data1 == data2).all())
+    return None
 
 
-@_is_equivalent_dispatcher.register
+def _typed_scalars(data: set):
+    """Return the elements of a set paired with their types if they are all scalars.
+
+    Returns None if any element is a container, whose contents may differ in type.
+    """
+    if all(isinstance(e, (str, bytes, int, float)) for e in data):
+        return {(type(e), e) for e in data}
+    return None
+
+
+@_register(set)
 def _check_unordered_sequences(
     data1: set,
     data2: set,
     **kwargs,
 ):
-    """Check equality of sequence after sorting."""
+    """Check equality of sequence after sorting.
+
+    Sets of scalars that are equal by hash lookup and whose elements have the same
+    types are accepted without sorting. Elements that can't be sorted are matched pairwise.
+    """
     if len(data1) != len(data2):
         return False
-    return all(is_equivalent(e1, e2, **kwargs) for e1, e2 in zip(sorted(data1), sorted(data2)))
-
-
-@_is_equivalent_dispatcher.register
+    if data1 == data2:
+        if not kwargs.get("strict_type", True):
+            return True
+        typed1 = _typed_scalars(data1)
+        if typed1 is not None and typed1 == _typed_scalars(data2):
+            return True
+    try:
+        return all(is_equivalent(e1, e2, **kwargs) for e1, e2 in zip(sorted(data1), sorted(data2)))
+    except TypeError:
+        pass
+    unmatched = list(data2)
+    for e1 in data1:
+        for i, e2 in enumerate(unmatched):
+            if is_equivalent(e1, e2, **kwargs):
+                del unmatched[i]
+                break
+        else:
+            return False
+    return True
+
+
+@_register(uncertainties.UFloat)
 def _check_ufloats(
     data1: uncertainties.UFloat,
     data2: uncertainties.UFloat,
@@ -182,7 +340,8 @@ def _check_ufloats(
     return is_equivalent(data1.n, data2.n, **kwargs) and is_equivalent(data1.s, data2.s, **kwargs)
 
 
-@_is_equivalent_dispatcher.register
+@_register(Model)
+@_memoized
 def _check_lmfit_models(
     data1: Model,
     data2: Model,
@@ -192,17 +351,44 @@ def _check_lmfit_models(
     return is_equivalent(data1.dumps(), data2.dumps(), **kwargs)
 
 
-@_is_equivalent_dispatcher.register
+@_register(DataAction, DataProcessor)
 def _check_dataprocessing_instances(
     data1: Union[DataAction, DataProcessor],
     data2: Union[DataAction, DataProcessor],
     **kwargs,
 ):
     """Check equality of classes in the data_processing module."""
+    if isinstance(data1, DataProcessor) and isinstance(data2, DataProcessor):
+        # Compare the nodes one by one instead of formatting the whole processor
+        if type(data1) is not type(data2) or data1._input_key != data2._input_key:
+            return False
+        return is_equivalent(data1._nodes, data2._nodes, **kwargs)
+    # Nodes define their representation from their options and parameters
     return repr(data1) == repr(data2)
 
 
-@_is_equivalent_dispatcher.register
+_CURVEFIT_RESULT_ATTRS = operator.attrgetter(
+    "method",
+    "model_repr",
+    "success",
+    "nfev",
+    "message",
+    "dof",
+    "init_params",
+    "chisq",
+    "reduced_chisq",
+    "aic",
+    "bic",
+    "params",
+    "var_names",
+    "x_data",
+    "y_data",
+    "covar",
+)
+
+
+@_register(CurveFitResult)
+@_memoized
 def _check_curvefit_results(
     data1: CurveFitResult,
     data2: CurveFitResult,
@@ -210,31 +396,30 @@ def _check_curvefit_results(
 ):
     """Check equality of curve fit result."""
     return _check_all_attributes(
-        attrs=[
-            "method",
-            "model_repr",
-            "success",
-            "nfev",
-            "message",
-            "dof",
-            "init_params",
-            "chisq",
-            "reduced_chisq",
-            "aic",
-            "bic",
-            "params",
-            "var_names",
-            "x_data",
-            "y_data",
-            "covar",
-        ],
+        getter=_CURVEFIT_RESULT_ATTRS,
         data1=data1,
         data2=data2,
         **kwargs,
     )
 
 
-@_is_equivalent_dispatcher.register
+_ANALYSIS_RESULT_ATTRS = operator.attrgetter(
+    "name",
+    "value",
+    "extra",
+    "device_components",
+    "result_id",
+    "experiment_id",
+    "chisq",
+    "quality",
+    "verified",
+    "tags",
+    "auto_save",
+    "source",
+)
+
+
+@_register(AnalysisResult)
 def _check_service_analysis_results(
     data1: AnalysisResult,
     data2: AnalysisResult,
@@ -242,27 +427,15 @@ def _check_service_analysis_results(
 ):
     """Check equality of AnalysisResult class which is payload for experiment service."""
     return _check_all_attributes(
-        attrs=[
-            "name",
-            "value",
-            "extra",
-            "device_components",
-            "result_id",
-            "experiment_id",
-            "chisq",
-            "quality",
-            "verified",
-            "tags",
-            "auto_save",
-            "source",
-        ],
+        getter=_ANALYSIS_RESULT_ATTRS,
         data1=data1,
         data2=data2,
         **kwargs,
     )
 
 
-@_is_equivalent_dispatcher.register
+@_register(BaseExperiment, BaseAnalysis, BaseDrawer)
+@_memoized
 def _check_configurable_classes(
     data1: Union[BaseExperiment, BaseAnalysis, BaseDrawer],
     data2: Union[BaseExperiment, BaseAnalysis, BaseDrawer],
@@ -272,51 +445,63 @@ def _check_configurable_classes(
     return is_equivalent(data1.config(), data2.config(), **kwargs)
 
 
-@_is_equivalent_dispatcher.register
+_EXPERIMENT_DATA_ATTRS = operator.attrgetter(
+    "experiment_id",
+    "experiment_type",
+    "parent_id",
+    "tags",
+    "job_ids",
+    "figure_names",
+    "share_level",
+    "metadata",
+)
+
+
+@_register(ExperimentData)
 def _check_experiment_data(
     data1: ExperimentData,
     data2: ExperimentData,
     **kwargs,
 ):
     """Check equality of ExperimentData."""
-    attributes_equiv = _check_all_attributes(
-        attrs=[
-            "experiment_id",
-            "experiment_type",
-            "parent_id",
-            "tags",
-            "job_ids",
-            "figure_names",
-            "share_level",
-            "metadata",
-        ],
+    if not _check_all_attributes(
+        getter=_EXPERIMENT_DATA_ATTRS,
         data1=data1,
         data2=data2,
         **kwargs,
-    )
-    data_equiv = is_equivalent(
-        data1.data(),
-        data2.data(),
+    ):
+        return False
+    # Compare the result data containers in place instead of copying them with data().
+    # The data of both sides are still retrieved from their jobs if missing.
+    data1._retrieve_data()
+    data2._retrieve_data()
+    if not is_equivalent(
+        data1._result_data,
+        data2._result_data,
         **kwargs,
-    )
-    analysis_results_equiv = is_equivalent(
+    ):
+        return False
+    if not is_equivalent(
         data1._analysis_results,
         data2._analysis_results,
         **kwargs,
-    )
-    child_equiv = is_equivalent(
+    ):
+        return False
+    return is_equivalent(
         data1.child_data(),
         data2.child_data(),
         **kwargs,
     )
-    return all([attributes_equiv, data_equiv, analysis_results_equiv, child_equiv])
 
 
 def _check_all_attributes(
-    attrs: List[str],
+    getter: operator.attrgetter,
     data1: Any,
     data2: Any,
     **kwargs,
 ):
-    """Helper function to check all attributes."""
-    return all(is_equivalent(getattr(data1, att), getattr(data2, att), **kwargs) for att in attrs)
+    """Helper function to check all attributes fetched by an attribute getter."""
+    return all(
+        is_equivalent(value1, value2, **kwargs)
+        for value1, value2 in zip(getter(data1), getter(data2))
+    )
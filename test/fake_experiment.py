@@ -30,7 +30,8 @@ class FakeAnalysis(BaseAnalysis):
         seed = self.options.get("seed", None)
         rng = np.random.default_rng(seed=seed)
         analysis_results = [
-            AnalysisResultData(f"result_{i}", value) for i, value in enumerate(rng.random(3))
+            AnalysisResultData(f"result_{i}", value)
+            for i, value in enumerate(rng.random(3).tolist())
         ]
         figures = None
         add_figures = self.options.get("add_figures", False)
@@ -0,0 +1,49 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the extended equality helper of the test suite."""
+
+from test.base import QiskitExperimentsTestCase
+from test.extended_equality import is_equivalent
+
+import numpy as np
+from ddt import ddt, data, unpack
+
+
+@ddt
+class TestExtendedEquality(QiskitExperimentsTestCase):
+    """Test the extended equality helper."""
+
+    @data(
+        [np.inf, np.inf, 0.0, True],
+        [np.inf, np.inf, 1e-8, True],
+        [-np.inf, -np.inf, 1e-8, True],
+        [np.inf, -np.inf, 1e-8, False],
+        [np.inf, 1.0, 1e-8, False],
+        [np.nan, np.nan, 1e-8, True],
+        [1.0, 1.0 + 1e-10, 0.0, False],
+        [1.0, 1.0 + 1e-10, 1e-8, True],
+    )
+    @unpack
+    def test_floats_scalar_and_array(self, value1, value2, precision, expected):
+        """Test floats are compared the same way as scalars and in arrays."""
+        pairs = {
+            # Separate scalar objects, so that the identity shortcut isn't taken
+            "scalar": (np.float64(value1), np.float64(value2)),
+            "0-d array": (np.array(value1), np.array(value2)),
+            "1-d array": (np.array([value1]), np.array([value2])),
+        }
+        for form, (data1, data2) in pairs.items():
+            with self.subTest(form=form):
+                self.assertEqual(
+                    is_equivalent(data1, data2, numerical_precision=precision), expected
+                )